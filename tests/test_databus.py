@@ -35,3 +35,29 @@ def test_databus_subscribe_unsubscribe() -> None:
     bus.unsubscribe(listener)
     bus.append({"P04": "CC"}, {"P06": 2})
     assert seen == [1]
+
+
+def test_databus_snapshot_count_is_monotonic() -> None:
+    bus = DataBus(maxlen=2)
+    for value in range(3):
+        bus.append({}, {"P06": value})
+
+    records, count = bus.snapshot_with_count()
+    assert [record["P06"] for record in records] == [1, 2]
+    assert count == 3
+
+    bus.reset()
+    bus.append({}, {"P06": 3})
+    assert bus.snapshot_with_count()[1] == 4
+    assert bus.sample_count() == 4
+
+
+def test_databus_latest_returns_last_record() -> None:
+    bus = DataBus(maxlen=2)
+    assert bus.latest() is None
+    bus.append({}, {"P06": 1})
+    bus.append({}, {"P06": 2})
+    assert bus.latest() == {"P06": 2}
+
+    bus.reset()
+    assert bus.latest() is None
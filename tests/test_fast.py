@@ -0,0 +1,43 @@
+"""Tests für die numerischen Kernfunktionen."""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PySide6", reason="PySide6 nicht verfügbar", exc_type=ImportError)
+
+from wtc3_logger.ui._fast import fill_x, finite_stats, m4_bins
+
+
+def test_finite_stats_skips_non_finite_entries() -> None:
+    arr = np.array([np.nan, 3.0, np.inf, -1.0, 7.0, 2.0, np.nan])
+    assert finite_stats(arr) == (-1.0, 7.0, 2.0, 4)
+    mn, mx, last, count = finite_stats(np.array([np.nan, -np.inf]))
+    assert (mn, mx, count) == (math.inf, -math.inf, 0)
+    assert math.isnan(last)
+
+
+def test_fill_x_uses_index_for_missing_values() -> None:
+    raw = np.array([10.0, np.nan, 12.0])
+    out = np.empty_like(raw)
+    fill_x(raw, out)
+    assert out.tolist() == [10.0, 1.0, 12.0]
+
+    fill_x(raw, out, 40.0)
+    assert out.tolist() == [10.0, 41.0, 12.0]
+
+
+def test_m4_bins_keeps_extremes_per_bin() -> None:
+    x = np.arange(8, dtype=np.float32)
+    y = np.array([1.0, 5.0, -2.0, 3.0, 0.0, 9.0, 4.0, 2.0], dtype=np.float32)
+    out_x = np.empty(8, dtype=np.float32)
+    out_y = np.empty(8, dtype=np.float32)
+
+    count = m4_bins(x, y, 2, out_x, out_y)
+
+    assert count == 8
+    assert out_y[:4].tolist() == [1.0, 5.0, -2.0, 3.0]
+    assert out_y[4:].tolist() == [0.0, 0.0, 9.0, 2.0]
+    assert out_x[4:].tolist() == [4.0, 4.0, 5.0, 7.0]
@@ -2,16 +2,38 @@
 from __future__ import annotations
 
 from dataclasses import replace
+import threading
 
+import numpy as np
 import pytest
 
 pytest.importorskip("PySide6", reason="PySide6 nicht verfügbar", exc_type=ImportError)
 pytest.importorskip("pyqtgraph", reason="pyqtgraph nicht verfügbar", exc_type=ImportError)
 
+from PySide6 import QtCore, QtWidgets
+import pyqtgraph as pg
+
 from wtc3_logger.config import AppConfig
 from wtc3_logger.databus import DataBus
+from wtc3_logger.status import StatusDetail, decode_status
+from wtc3_logger.ui.pdf_report import ParameterStatistic
 from wtc3_logger.ui.config_dialog import ConfigDialog
-from wtc3_logger.ui.main_window import MainWindow
+from wtc3_logger.ui.main_window import (
+    CurveBuffer,
+    MainWindow,
+    MetaDetailPanel,
+    ParameterRow,
+    ParameterSetting,
+    ParameterSidebar,
+    SeriesCache,
+    StatusBadgeBar,
+    UnitPlot,
+    _FALLBACK_PALETTE,
+    _column_stats,
+    _extrapolation_weights,
+    _minmax_indices,
+    _numeric_block,
+)
 
 
 def _create_window(qapp: object) -> MainWindow:
@@ -33,7 +55,7 @@ def test_voltage_axis_starts_at_zero(qapp) -> None:
         records = [{"P45": 4.0}, {"P45": 4.5}]
         window._update_curves(x_data, records)
 
-        y_min, y_max = window._unit_plots["V"].plot.getPlotItem().viewRange()[1]
+        y_min, y_max = window._unit_plots["V"].plot.viewRange()[1]
         assert y_min == pytest.approx(0.0)
         assert y_max >= 4.5
     finally:
@@ -54,9 +76,721 @@ def test_temperature_axis_uses_meta_limits(qapp) -> None:
         records = [{"P60": 21.0}, {"P60": 24.0}]
         window._update_curves(x_data, records)
 
-        y_min, y_max = window._unit_plots["°C"].plot.getPlotItem().viewRange()[1]
+        y_min, y_max = window._unit_plots["°C"].plot.viewRange()[1]
         assert y_min == pytest.approx(0.0)
         assert y_max == pytest.approx(45.0)
+
+        window._temperature_limits = (1.0, 2.0)
+        window._handle_meta_parameters(meta)
+        assert window._temperature_limits == (1.0, 2.0)
+        window._handle_meta_parameters({**meta, "P76": "500"})
+        assert window._temperature_limits == (0.0, 50.0)
+    finally:
+        window.close()
+
+
+def test_update_curves_appends_fresh_tail_and_rebuilds(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        for key in ("P45", "P61"):
+            window._parameter_settings[key] = replace(window._parameter_settings[key], visible=True)
+        window._update_plot_visibility()
+
+        records = [{"P45": 4.0, "P61": 20.0}, {"P45": "n/a", "P61": float("inf")}]
+        window._update_curves([0.0, 1.0], records)
+        records.append({"P45": 4.5, "P61": 22.0})
+        window._update_curves([0.0, 1.0, 2.0], records, fresh=1)
+
+        assert list(window._curve_buffers["P45"].view()[1]) == [4.0, 4.5]
+        assert list(window._curve_buffers["P61"].view()[1]) == [20.0, 22.0]
+
+        window._update_curves([0.0, 1.0, 2.0], records)
+        assert len(window._curve_buffers["P45"]) == 2
+        assert len(window._curve_buffers["P61"]) == 2
+    finally:
+        window.close()
+
+
+def test_update_curves_skips_set_data_without_new_samples(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        window._parameter_settings["P45"] = replace(window._parameter_settings["P45"], visible=True)
+        window._update_plot_visibility()
+        records = [{"P45": 4.0}, {"P45": 4.5}]
+        window._update_curves([0.0, 1.0], records)
+
+        curve = window._curves["P45"]
+        calls = []
+        original = curve.setData
+        curve.setData = lambda *args, **kwargs: (calls.append(args), original(*args, **kwargs))
+        window._update_curves([0.0, 1.0], records, fresh=0)
+        assert calls == []
+
+        records.append({"P45": 5.0})
+        window._update_curves([0.0, 1.0, 2.0], records, fresh=1)
+        assert len(calls) == 1
+        assert window._unit_plots["V"].plot.viewRange()[1][1] >= 5.0
+    finally:
+        window.close()
+
+
+def test_series_cache_projects_only_fresh_records() -> None:
+    cache = SeriesCache()
+    records = [{"A": 1, "B": "x"}, {"A": 2.5}]
+    cache.sync(records)
+    assert list(cache.column("A")) == [1.0, 2.5]
+    assert np.isnan(cache.column("B")).all()
+
+    # Wie die DataBus-Deque: alte Einträge fallen heraus, neue kommen hinzu.
+    window = records
+    for step in range(20):
+        window = window[-1:] + [{"A": step, "B": "x"}, {"A": step + 0.5, "B": step}]
+        cache.sync(window, fresh=2)
+    reference = SeriesCache()
+    reference.sync(window)
+    assert len(cache) == 3
+    np.testing.assert_array_equal(cache.column("A"), reference.column("A"))
+    np.testing.assert_array_equal(cache.column("B"), reference.column("B"))
+    np.testing.assert_array_equal(cache.column("C", keep=False), np.full(3, np.nan))
+
+
+def test_series_cache_prefetch_projects_missing_keys_together(monkeypatch) -> None:
+    cache = SeriesCache()
+    cache.sync([{"A": 1, "B": 2}, {"A": 3, "B": "x"}])
+    cache.column("A")
+
+    calls = []
+    original = _numeric_block
+    monkeypatch.setattr(
+        "wtc3_logger.ui.main_window._numeric_block",
+        lambda records, keys: (calls.append(list(keys)), original(records, keys))[1],
+    )
+    cache.prefetch(["A", "B", "C", "B"])
+    assert calls == [["B", "C"]]
+    assert cache.column("B")[0] == 2.0 and np.isnan(cache.column("B")[1])
+
+    cache.sync([{"A": 5, "B": 6, "C": 7}])
+    assert calls[-1] == ["A", "B", "C"]
+    assert cache.column("C").tolist() == [7.0]
+
+
+def test_series_cache_block_mixes_cached_and_projected_columns() -> None:
+    cache = SeriesCache()
+    records = [{"A": 1, "B": 2}, {"A": "x", "B": 3.5}]
+    cache.sync(records)
+    assert cache.stats(["B"]) == {"B": (2.0, 3.5, 3.5)}
+
+    cache.column("A")
+    block = cache.block(["B", "A", "C"])
+    assert block.shape == (3, 2)
+    assert block[0].tolist() == [2.0, 3.5]
+    assert block[1][0] == 1.0 and np.isnan(block[1][1])
+    assert np.isnan(block[2]).all()
+
+
+@pytest.mark.parametrize("have_numba", [False, True])
+def test_series_cache_stats_use_kernel_or_numpy(monkeypatch, have_numba) -> None:
+    monkeypatch.setattr("wtc3_logger.ui._fast.HAVE_NUMBA", have_numba)
+    cache = SeriesCache()
+    cache.sync([{"A": 2, "B": "x"}, {"A": np.inf, "B": "y"}, {"A": -1.5}, {"A": "x"}])
+    assert cache.stats(["A", "B"]) == {"A": (-1.5, 2.0, -1.5)}
+
+
+def test_series_cache_stats_follow_sliding_window() -> None:
+    cache = SeriesCache()
+    rng = np.random.default_rng(7)
+    window: list = []
+    for step in range(200):
+        fresh = int(rng.integers(0, 4))
+        for _ in range(fresh):
+            value = float(rng.normal())
+            window.append({"A": value if value > -1.5 else "x", "B": "x"})
+        window = window[-25:]
+        cache.sync(list(window), fresh=fresh)
+        if step % 3:
+            cache.column("A")
+            stats = cache.stats(["A", "B", "C"])
+            values = [record["A"] for record in window if record["A"] != "x"]
+            assert "B" not in stats and "C" not in stats
+            if values:
+                assert stats["A"] == (min(values), max(values), values[-1])
+            else:
+                assert "A" not in stats
+
+
+def test_refresh_interval_subtracts_predicted_delay(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        period = window._refresh_period_ms()
+        assert window._next_refresh_interval() == period
+
+        window._refresh_delays.extend([0.02] * 30)
+        assert window._next_refresh_interval() == pytest.approx(period - 20, abs=1)
+
+        window._refresh_delays.extend([1.0] * 30)
+        assert window._next_refresh_interval() == 1
+        assert window._timer.isSingleShot()
+        assert window._timer.timerType() == QtCore.Qt.TimerType.CoarseTimer
+
+        window._on_config_changed(AppConfig(ui_refresh_hz=60.0))
+        assert window._timer.timerType() == QtCore.Qt.TimerType.PreciseTimer
+    finally:
+        window.close()
+
+
+@pytest.mark.parametrize("count", [10, 57, 300])
+def test_extrapolation_weights_match_polynomial_fit(count) -> None:
+    samples = np.random.default_rng(count).random(count)
+    fit = np.polynomial.Polynomial.fit(np.arange(count), samples, 5)
+    assert _extrapolation_weights(count) @ samples == pytest.approx(fit(count))
+    assert _extrapolation_weights(count) is _extrapolation_weights(count)
+
+
+def test_status_markers_only_at_transitions(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        records = [{"P05": value} for value in (0, 0, 1, "1", None, None, 1)]
+        x_data = [float(index) for index in range(len(records))]
+
+        markers = window._collect_status_markers(x_data, records)
+
+        assert [marker.position for marker in markers] == [2.0, 4.0]
+        assert all(marker.label for marker in markers)
+        assert window._decode_status("1") is window._decode_status(1)
+        assert window._collect_status_markers(x_data, records) is markers
+
+        window._on_config_changed(AppConfig())
+        assert window._status_cache == {}
+        assert window._collect_status_markers(x_data, records) is not markers
+    finally:
+        window.close()
+
+
+def test_status_markers_read_the_status_column_transiently(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        for index, value in enumerate((0, 0, 1, 1, 0, 0)):
+            window.databus.append({}, {"P06": index, "P05": value})
+        window.refresh()
+        records = window._last_records
+        assert window._series.holds(records)
+
+        markers = window._collect_status_markers(window._extract_x(records), records)
+
+        assert [marker.position for marker in markers] == [2.0, 4.0]
+        assert "P05" not in window._series._columns
+    finally:
+        window.close()
+
+
+@pytest.mark.parametrize("have_numba", [False, True])
+def test_extract_x_is_reused_for_the_same_snapshot(qapp, monkeypatch, have_numba) -> None:
+    window = _create_window(qapp)
+    monkeypatch.setattr("wtc3_logger.ui._fast.HAVE_NUMBA", have_numba)
+    try:
+        records = [{"P06": 1.0}, {"P06": "x"}, {"P06": 3.0}]
+        x_data = window._extract_x(records)
+        assert x_data.tolist() == [1.0, 1.0, 3.0]
+        assert window._extract_x(records) is x_data
+
+        records = records + [{"P06": 4.0}]
+        assert window._extract_x(records).tolist() == [1.0, 1.0, 3.0, 4.0]
+    finally:
+        window.close()
+
+
+def test_latest_status_is_redecoded_on_config_change(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        window.databus.append({}, {"P06": 0, "P05": 1})
+        window.refresh()
+        detail = window._last_status_detail
+        assert window._last_status_value == 1
+
+        config = AppConfig(status_bits={0: "Ladefreigabe"})
+        window._on_config_changed(config)
+        assert window._last_status_detail is not detail
+        assert window._last_status_detail == decode_status(1, config.status_bits)
+    finally:
+        window.close()
+
+
+def test_zoom_reprojects_curves_without_new_samples(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        window._timer.stop()
+        window.resize(1200, 700)
+        window.show()
+        for index in range(50):
+            window.databus.append({}, {"P06": index, "P45": 4.0 + index % 3})
+        window.refresh()
+        qapp.processEvents()
+        # Das Layout kann die Plotbreite nach dem ersten Refresh noch ändern.
+        window.refresh()
+        plot = window._unit_plots["V"]
+        assert window._curve_state["P45"][1] == plot.bin_count() > 0
+        assert not window._refresh_pending
+
+        plot.plot.setXRange(10, 20)
+        qapp.processEvents()
+        assert window._refresh_pending
+
+        window.refresh()
+        assert window._curve_state["P45"][1] == plot.bin_count() == 0
+    finally:
+        window.close()
+
+
+def test_auto_stop_fires_while_minimized(qapp) -> None:
+    from datetime import datetime, timedelta
+
+    class Controller:
+        stopped = False
+
+        def stop(self) -> None:
+            self.stopped = True
+
+        def raw_log_path(self):
+            return None
+
+    window = _create_window(qapp)
+    controller = Controller()
+    try:
+        window._controller = controller
+        window._auto_stop_enabled = True
+        window.showMinimized()
+        qapp.processEvents()
+        assert not window._timer.isActive()
+        assert window._auto_stop_timer.isActive()
+
+        window.databus.append({}, {"P06": 0, "P05": 3})
+        window._on_auto_stop_timer()
+        assert window._auto_stop_since is not None
+        window._auto_stop_since = datetime.now() - timedelta(minutes=2)
+        window._on_auto_stop_timer()
+        assert controller.stopped
+
+        window.showNormal()
+        qapp.processEvents()
+        assert not window._auto_stop_timer.isActive()
+    finally:
+        window._controller = None
+        window.close()
+
+
+def test_opengl_only_on_request(qapp, monkeypatch) -> None:
+    monkeypatch.setattr("wtc3_logger.ui.main_window.OpenGL", object())
+    window = _create_window(qapp)
+    try:
+        assert pg.getConfigOption("useOpenGL") is False
+        assert pg.getConfigOption("enableExperimental") is False
+    finally:
+        window.close()
+
+
+def test_curve_item_cache_only_for_idle_curves(qapp) -> None:
+    window = _create_window(qapp)
+    cached = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+    try:
+        window.databus.append({}, {"P06": 0, "P45": 4.0})
+        window.refresh()
+        curve = window._curves["P45"].curve
+        assert curve.cacheMode() == QtWidgets.QGraphicsItem.CacheMode.NoCache
+
+        window._refresh_pending = True
+        window.refresh()
+        assert curve.cacheMode() == cached
+
+        window.databus.append({}, {"P06": 1, "P45": 4.1})
+        window.refresh()
+        assert curve.cacheMode() == QtWidgets.QGraphicsItem.CacheMode.NoCache
+
+        pg.setConfigOptions(useOpenGL=True)
+        try:
+            window._refresh_pending = True
+            window.refresh()
+            assert curve.cacheMode() == QtWidgets.QGraphicsItem.CacheMode.NoCache
+        finally:
+            pg.setConfigOptions(useOpenGL=False)
+    finally:
+        window.close()
+
+
+def test_key_moving_into_meta_drops_its_curve(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        window.databus.append({}, {"P06": 0, "P45": 4.0})
+        window.refresh()
+        plot = window._unit_plots["V"].plot
+        item = window._curves["P45"]
+        assert item in plot.listDataItems()
+
+        window.databus.append({"P45": "4.0"}, {"P06": 1})
+        window.refresh()
+
+        assert item not in plot.listDataItems()
+        assert all(sample is not item for sample, _label in plot.legend.items)
+        assert "P45" not in window._curve_state
+        assert "P45" not in window._curves
+    finally:
+        window.close()
+
+
+def test_plot_stack_scrolls_instead_of_squeezing_rows(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        stack = window._plot_stack
+        assert window._plots_scroll.widget() is stack
+        stack.set_plots([UnitPlot() for _ in range(5)])
+        assert stack.view.minimumHeight() == 5 * 180 + 4 * 16
+        assert stack.minimumSizeHint().height() > 5 * 180
+    finally:
+        window.close()
+
+
+def test_refresh_skips_work_without_new_samples(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        window.databus.append({}, {"P06": 0, "P45": 4.0})
+        window.refresh()
+
+        calls = []
+        window._update_curves = lambda *args, **kwargs: calls.append(args)
+        window.refresh()
+        assert calls == []
+
+        window._on_parameter_setting_changed("P45", window._parameter_settings["P45"])
+        window.refresh()
+        assert len(calls) == 1
+
+        window.databus.append({}, {"P06": 1, "P45": 4.1})
+        window.refresh()
+        assert len(calls) == 2
+    finally:
+        window.close()
+
+
+def test_color_for_key_caches_defaults_but_honours_overrides(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        default = window._color_for_key("P45")
+        assert window._resolved_colors["P45"] == default
+
+        window._color_overrides["P45"] = "#010203"
+        assert window._color_for_key("P45") == "#010203"
+
+        start = len(window._fallback_colors)
+        fallback = [window._color_for_key(key) for key in ("X1", "X2", "X1")]
+        assert fallback[0] == fallback[2]
+        assert fallback[:2] == [_FALLBACK_PALETTE[(start + i) % len(_FALLBACK_PALETTE)] for i in range(2)]
+    finally:
+        window.close()
+
+
+def test_active_units_are_cached_until_settings_change(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        units = window._collect_active_units()
+        assert window._collect_active_units() is units
+        settings = window._settings_in_order()
+        assert window._settings_in_order() is settings
+
+        setting = window._parameter_settings["P45"]
+        setting.visible = not setting.visible
+        window._on_parameter_setting_changed("P45", setting)
+        assert window._collect_active_units() is not units
+        assert window._settings_in_order() is not settings
+        assert ("P45" in window._active_graph_keys()) is setting.visible
+    finally:
+        window.close()
+
+
+def test_section_changes_repopulate_the_sidebar_once(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        calls = []
+        original = window.sidebar.populate
+        window.sidebar.populate = lambda settings: (calls.append(1), original(settings))
+
+        for key in ("P45", "P61"):
+            setting = window._parameter_settings[key]
+            setting.visible = not setting.visible
+            window._on_parameter_setting_changed(key, setting)
+        assert calls == []
+
+        qapp.processEvents()
+        assert calls == [1]
+        assert window.sidebar._placed_visible["P61"] is window._parameter_settings["P61"].visible
+    finally:
+        window.close()
+
+
+def test_plot_layout_rebuilt_only_when_units_change(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        calls = []
+        original = window._rebuild_plot_layout
+        window._rebuild_plot_layout = lambda units: (calls.append(tuple(units)), original(units))
+
+        window._ensure_visible_units()
+        window._ensure_visible_units()
+        assert calls == []
+
+        setting = window._parameter_settings["P61"]
+        setting.visible = False
+        window._on_parameter_setting_changed("P61", setting)
+        assert len(calls) == 1
+        assert "°C" not in calls[0]
+    finally:
+        window.close()
+
+
+def test_curve_pen_follows_colour_change(qapp, monkeypatch) -> None:
+    monkeypatch.setattr("wtc3_logger.ui.main_window.save_preferences", lambda _data: None)
+    window = _create_window(qapp)
+    try:
+        window._parameter_settings["P45"] = replace(window._parameter_settings["P45"], visible=True)
+        window._update_plot_visibility()
+        window._update_curves([0.0, 1.0], [{"P45": 4.0}, {"P45": 4.5}])
+
+        window._on_row_color_change("P45", "#abcdef")
+        assert window._curves["P45"].opts["pen"].color().name() == "#abcdef"
+    finally:
+        window._color_overrides.pop("P45", None)
+        window.close()
+
+
+def test_export_pdf_renders_off_the_ui_thread(qapp, tmp_path, monkeypatch) -> None:
+    window = _create_window(qapp)
+    try:
+        target = tmp_path / "report.pdf"
+        threads = []
+        counts = []
+
+        def choose_file(*args, **kwargs):
+            # Der Dialog lässt Refreshes weiterlaufen.
+            window.databus.append({}, {"P06": 2, "P45": 4.4})
+            window.refresh()
+            return str(target), ""
+
+        def render(path, *args):
+            threads.append(threading.current_thread())
+            counts.append((args[9], len(args[7][0].x_values)))
+
+        monkeypatch.setattr(QtWidgets.QFileDialog, "getSaveFileName", staticmethod(choose_file))
+        monkeypatch.setattr("wtc3_logger.ui.main_window.render_measurement_report", render)
+        window.databus.append({}, {"P06": 0, "P45": 4.0})
+        window.databus.append({}, {"P06": 1, "P45": 4.2})
+        window.refresh()
+
+        window._export_pdf()
+        assert window._report_future is not None
+        assert not window._pdf_action.isEnabled()
+        window._report_future.result(timeout=5)
+        for _ in range(100):
+            if window._report_future is None:
+                break
+            qapp.processEvents()
+        assert threads and threads[0] is not threading.main_thread()
+        assert counts == [(3, 3)]
+        assert window._pdf_action.isEnabled()
+        assert window.status.currentMessage() == f"Report saved to {target}"
+    finally:
+        window.close()
+
+
+def test_export_pdf_uses_meta_from_the_same_refresh_as_records(qapp, tmp_path, monkeypatch) -> None:
+    window = _create_window(qapp)
+    try:
+        calls = []
+
+        def choose_file(*args, **kwargs):
+            # Neuer Header während des Dialogs: Meta und Records kommen
+            # gemeinsam aus dem letzten Refresh, nicht vom DataBus.
+            window.databus.append({"P04": "9"}, {"P06": 1, "P45": 4.2})
+            window.refresh()
+            window.databus.append({"P04": "7"}, {"P06": 2, "P45": 4.4})
+            return str(tmp_path / "report.pdf"), ""
+
+        monkeypatch.setattr(QtWidgets.QFileDialog, "getSaveFileName", staticmethod(choose_file))
+        monkeypatch.setattr("wtc3_logger.ui.main_window.render_measurement_report", lambda *args: calls.append(args))
+        window.databus.append({"P04": "2"}, {"P06": 0, "P45": 4.0})
+        window.refresh()
+
+        window._export_pdf()
+        window._report_future.result(timeout=5)
+        meta, strategy_code, count = calls[0][1], calls[0][4], calls[0][10]
+        assert meta["P04"] == strategy_code == "9"
+        assert count == 2
+    finally:
+        window.close()
+
+
+def test_export_pdf_recreates_a_deleted_default_dir(qapp, tmp_path, monkeypatch) -> None:
+    window = _create_window(qapp)
+    try:
+        log_dir = tmp_path / "logs"
+        window.config.persist_path = log_dir / "raw.tsv"
+        suggested = []
+
+        def choose_file(parent, caption, path, *args):
+            suggested.append(path)
+            return "", ""
+
+        monkeypatch.setattr(QtWidgets.QFileDialog, "getSaveFileName", staticmethod(choose_file))
+        window.databus.append({}, {"P06": 0, "P45": 4.0})
+        window.refresh()
+
+        window._export_pdf()
+        assert log_dir.is_dir()
+        log_dir.rmdir()
+        window._export_pdf()
+        assert log_dir.is_dir()
+        assert len(suggested) == 2
+    finally:
+        window.close()
+
+
+def test_close_waits_for_running_export(qapp, tmp_path, monkeypatch) -> None:
+    window = _create_window(qapp)
+    started = threading.Event()
+    release = threading.Event()
+    finished = []
+
+    def render(path, *args):
+        started.set()
+        release.wait(5)
+        finished.append(path)
+
+    monkeypatch.setattr(
+        QtWidgets.QFileDialog,
+        "getSaveFileName",
+        staticmethod(lambda *args, **kwargs: (str(tmp_path / "report.pdf"), "")),
+    )
+    monkeypatch.setattr("wtc3_logger.ui.main_window.render_measurement_report", render)
+    closed = []
+    monkeypatch.setattr("wtc3_logger.ui.main_window.close_report_renderer", lambda: closed.append(True))
+    window.databus.append({}, {"P06": 0, "P45": 4.0})
+    window.refresh()
+
+    window._export_pdf()
+    assert started.wait(5)
+    threading.Timer(0.05, release.set).start()
+    window.close()
+    assert finished == [tmp_path / "report.pdf"]
+    assert closed == [True]
+    assert window._report_executor is None
+    assert window._report_future is None
+
+
+@pytest.mark.parametrize("include_hidden", [False, True])
+def test_export_pdf_collects_hidden_stats_only_on_request(qapp, tmp_path, monkeypatch, include_hidden) -> None:
+    window = _create_window(qapp)
+    try:
+        window.config.include_hidden_stats = include_hidden
+        calls = []
+        monkeypatch.setattr(
+            QtWidgets.QFileDialog,
+            "getSaveFileName",
+            staticmethod(lambda *args, **kwargs: (str(tmp_path / "report.pdf"), "")),
+        )
+        monkeypatch.setattr("wtc3_logger.ui.main_window.render_measurement_report", lambda *args: calls.append(args))
+        window.databus.append({}, {"P06": 0, "P45": 4.0, "P40": 12.0})
+        window.refresh()
+
+        window._export_pdf()
+        window._report_future.result(timeout=5)
+        visible, hidden = calls[0][6], calls[0][7]
+        assert [stat.key for stat in visible] == ["P45"]
+        if include_hidden:
+            assert [stat.key for stat in hidden] == ["P40"]
+        else:
+            assert hidden is None
+    finally:
+        window.close()
+
+
+def test_series_for_pdf_masks_invalid_samples(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        records = [{"P06": 0, "P45": 4.0}, {"P06": 1, "P45": "x"}, {"P06": 2, "P45": 4.2}]
+        window._last_records = records
+        x_data = window._extract_x(records)
+        stat = ParameterStatistic("P45", "Spannung", "V", 4.0, 4.2, 4.2, "#123456", True)
+
+        (series,) = window._collect_series_for_pdf(x_data, [stat])
+
+        assert series.x_values.tolist() == [0.0, 2.0]
+        assert series.y_values.tolist() == [4.0, 4.2]
+        assert window._collect_series_for_pdf(x_data, [stat], {"P45": np.array([1.0, np.nan, np.nan])}) == []
+    finally:
+        window.close()
+
+
+def test_series_for_pdf_reduces_beyond_two_points_per_pixel(qapp) -> None:
+    from wtc3_logger.ui.pdf_report import CHART_PLOT_WIDTH
+
+    window = _create_window(qapp)
+    try:
+        stat = ParameterStatistic("P45", "Spannung", "V", 0.0, 1.0, 1.0, "#123456", True)
+        limit = 2 * CHART_PLOT_WIDTH
+        values = np.sin(np.arange(2 * limit, dtype=np.float64))
+
+        (kept,) = window._collect_series_for_pdf(values[:limit], [stat], {"P45": values[:limit]})
+        (reduced,) = window._collect_series_for_pdf(values, [stat], {"P45": values})
+
+        assert len(kept.y_values) == limit
+        assert len(reduced.y_values) <= limit + 4
+        assert reduced.y_values.min() == values.min()
+        assert reduced.y_values.max() == values.max()
+    finally:
+        window.close()
+
+
+def test_minmax_indices_keep_extrema_and_endpoints() -> None:
+    values = np.sin(np.linspace(0.0, 40.0, 10_003))
+    values[5000] = 3.0
+    values[7000] = -3.0
+    keep = _minmax_indices(values, 100)
+    assert len(keep) <= 2 * 100 + 4
+    assert np.all(np.diff(keep) > 0)
+    assert keep[0] == 0 and keep[-1] == len(values) - 1
+    assert {5000, 7000} <= set(keep.tolist())
+
+
+def test_column_stats_reduce_rows_and_skip_invalid() -> None:
+    block = np.array(
+        [
+            [3.0, np.nan, -1.0, 7.0, np.nan],
+            [np.nan, np.nan, np.nan, np.nan, np.nan],
+            [1.0, np.inf, 2.0, 0.5, 4.0],
+        ]
+    )
+    has_values, mins, maxs, lasts = _column_stats(block)
+    assert has_values.tolist() == [True, False, True]
+    assert (mins[0], maxs[0], lasts[0]) == (-1.0, 7.0, 7.0)
+    assert np.isnan([mins[1], maxs[1], lasts[1]]).all()
+    assert (mins[2], maxs[2], lasts[2]) == (0.5, 4.0, 4.0)
+
+
+def test_refresh_updates_meta_panel_only_on_change(qapp) -> None:
+    window = _create_window(qapp)
+    try:
+        calls = []
+        original = window.meta_panel.update_meta
+        window.meta_panel.update_meta = lambda *args: (calls.append(args), original(*args))
+
+        window.databus.append({"P70": "12"}, {"P06": 0, "P05": 1})
+        window.refresh()
+        window.databus.append({"P70": "12"}, {"P06": 1, "P05": 1})
+        window.refresh()
+        assert len(calls) == 1
+
+        window.databus.append({"P70": "13"}, {"P06": 2, "P05": 1})
+        window.refresh()
+        window.databus.append({"P70": "13"}, {"P06": 3, "P05": 2})
+        window.refresh()
+        assert len(calls) == 3
     finally:
         window.close()
 
@@ -90,3 +824,294 @@ def test_config_dialog_sample_selection(tmp_path, qapp) -> None:
     assert result.sample_file == sample.resolve()
     assert not result.serial.enabled
     dialog.deleteLater()
+
+
+def test_curve_buffer_keeps_window_after_wrap() -> None:
+    buffer = CurveBuffer(window=3, growth=2)
+    for start in range(0, 9, 2):
+        values = np.arange(start, start + 2, dtype=np.float64)
+        buffer.extend(values, values, values.astype(np.int64))
+
+    xs, ys = buffer.view()
+    assert xs.dtype.name == "float32"
+    assert list(xs) == [7.0, 8.0, 9.0]
+    assert list(ys) == [7.0, 8.0, 9.0]
+    assert len(buffer) == 3
+
+
+def test_curve_buffer_grows_by_doubling() -> None:
+    buffer = CurveBuffer(window=5000)
+    assert len(buffer._x) == 1024
+    values = np.arange(3000, dtype=np.float64)
+    buffer.extend(values, values, np.arange(3000))
+    assert len(buffer._x) == 4096
+    buffer.extend(values, values, np.arange(3000, 6000))
+    assert len(buffer._x) == 8192
+    xs, _ys = buffer.view()
+    assert xs[0] == 1000.0 and xs[-1] == 2999.0 and len(xs) == 5000
+
+
+def test_curve_buffer_trim_drops_rows_before_snapshot() -> None:
+    buffer = CurveBuffer(window=10)
+    buffer.extend(np.array([1.0, 5.0, 9.0]), np.array([2.0, 3.0, 4.0]), np.array([1, 5, 9]))
+    version = buffer.version
+
+    buffer.trim(5)
+    assert buffer.view()[0].tolist() == [5.0, 9.0]
+    assert buffer.version == version + 1
+
+    buffer.trim(5)
+    assert buffer.version == version + 1
+
+
+def test_sparse_curve_history_matches_snapshot(qapp) -> None:
+    databus = DataBus(maxlen=20)
+    window = MainWindow(databus, replace(AppConfig(), max_points=20))
+    try:
+        for index in range(100):
+            record = {"P06": index, "P61": 20.0}
+            if index % 4 == 0:
+                record["P45"] = 4.0
+            databus.append({}, record)
+            window.refresh()
+
+        xs, _ys = window._curve_buffers["P45"].view()
+        assert xs.tolist() == [80.0, 84.0, 88.0, 92.0, 96.0]
+        assert window._curve_buffers["P61"].view()[0][0] == 80.0
+    finally:
+        window.close()
+
+
+def test_missing_x_stays_consistent_across_rollover(qapp) -> None:
+    databus = DataBus(maxlen=5)
+    window = MainWindow(databus, replace(AppConfig(), max_points=5))
+    try:
+        for _ in range(12):
+            databus.append({}, {"P45": 4.0})
+            window.refresh()
+
+        xs, _ys = window._curve_buffers["P45"].view()
+        assert xs.tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+        assert window._extract_x(window._last_records).tolist() == xs.tolist()
+    finally:
+        window.close()
+
+
+def test_parameter_row_toggle_switches_state_property(qapp) -> None:
+    del qapp
+    row = ParameterRow(ParameterSetting("P45", "Spannung", "V", "#123456", visible=True), None)
+    try:
+        assert row._info_label.property("state") == "active"
+        row._visible_box.setChecked(False)
+        assert row._info_label.property("state") == "muted"
+        assert row.setting().visible is False
+    finally:
+        row.deleteLater()
+
+
+def test_sidebar_populate_reuses_rows(qapp) -> None:
+    del qapp
+    sidebar = ParameterSidebar()
+    voltage = ParameterSetting("P45", "Spannung", "V", "#123456", visible=True)
+    current = ParameterSetting("P46", "Strom", "A", "#654321", visible=False)
+    try:
+        sidebar.populate([voltage, current])
+        row = sidebar._rows["P45"]
+
+        sidebar.populate([replace(voltage, visible=False), current])
+        assert sidebar._rows["P45"] is row
+        assert sidebar.setting("P45").visible is False
+
+        sidebar.populate([current])
+        assert "P45" not in sidebar._rows
+        # Die Zeilen tragen keine eigenen Stylesheets mehr.
+        assert sidebar._rows["P46"].findChild(QtWidgets.QFrame, "parameterRow").styleSheet() == ""
+    finally:
+        sidebar.deleteLater()
+
+
+def test_sidebar_update_row_keeps_placement(qapp) -> None:
+    del qapp
+    sidebar = ParameterSidebar()
+    voltage = ParameterSetting("P45", "Spannung", "V", "#123456", visible=True)
+    try:
+        sidebar.populate([voltage])
+        placement = sidebar._placement
+
+        assert sidebar.update_row(replace(voltage, color="#abcdef"))
+        assert sidebar._rows["P45"]._color_indicator.color().name() == "#abcdef"
+        assert not sidebar.update_row(replace(voltage, visible=False))
+        assert not sidebar.update_row(ParameterSetting("P46", "Strom", "A", "#000000", True))
+
+        sidebar.populate([sidebar.setting("P45")])
+        assert sidebar._placement is placement
+    finally:
+        sidebar.deleteLater()
+
+
+def test_sidebar_value_updates_are_coalesced(qapp) -> None:
+    del qapp
+    sidebar = ParameterSidebar()
+    try:
+        sidebar.populate([ParameterSetting("P45", "Spannung", "V", "#123456", visible=True)])
+        label = sidebar._rows["P45"]._value_label
+        before = label.text()
+
+        sidebar.update_value("P45", 4.0, "V")
+        sidebar.update_value("P45", 4.25, "V")
+        assert label.text() == before
+
+        sidebar._flush()
+        assert label.text().replace("\u00a0", " ").strip() == "4.250   V"
+    finally:
+        sidebar.deleteLater()
+
+
+def test_sidebar_flush_repaints_only_changed_labels(qapp) -> None:
+    class PaintCounter(QtCore.QObject):
+        count = 0
+
+        def eventFilter(self, watched, event):  # noqa: N802
+            if event.type() == QtCore.QEvent.Type.Paint:
+                self.count += 1
+            return False
+
+    sidebar = ParameterSidebar()
+    counter = PaintCounter()
+    try:
+        sidebar.populate(
+            [ParameterSetting(f"P{40 + index}", f"Wert {index}", "V", "#123456", visible=True) for index in range(15)]
+        )
+        sidebar.resize(320, 900)
+        sidebar.show()
+        qapp.processEvents()
+        for widget in sidebar.findChildren(QtWidgets.QWidget):
+            widget.installEventFilter(counter)
+
+        for step in range(5):
+            sidebar.update_value("P40", 4.0 + step, "V")
+            sidebar._flush()
+            qapp.processEvents()
+
+        assert counter.count < 15 * 5
+    finally:
+        sidebar.close()
+        sidebar.deleteLater()
+
+
+def test_status_badge_snapshot_translates_labels() -> None:
+    detail = StatusDetail(
+        raw_value=0,
+        badges=["Batteriespannung: Überspannung"],
+        details=["Fehler: ΔV Drop erreicht", "Unbekannt: Wert"],
+    )
+
+    snapshot = MainWindow._status_badge_snapshot(detail)
+
+    assert snapshot == {
+        "Battery Voltage": "Over Voltage",
+        "Fault": "Delta V reached",
+        "Unbekannt": "Wert",
+    }
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Überspannung", "Over Voltage"),
+        ("uberspannung", "Over Voltage"),
+        ("  ÜBERSPANNUNG ", "Over Voltage"),
+        ("Kühl", "Cool"),
+        ("Geringe  Kapazität", "Low Capacity"),
+        ("Δ T  Anstieg", "Delta T rise"),
+        # ß zerfällt nicht in ASCII und wird verworfen; nur "ss" trifft.
+        ("Heiss", "Hot"),
+        ("Heiß", "Heiß"),
+        ("UEBERSPANNUNG", "UEBERSPANNUNG"),
+    ],
+)
+def test_status_value_matching_folds_umlauts_case_and_spaces(raw, expected) -> None:
+    detail = StatusDetail(raw_value=0, badges=[f"Batteriespannung: {raw}"], details=[])
+    assert MainWindow._status_badge_snapshot(detail) == {"Battery Voltage": expected}
+
+
+def test_parameter_setting_sort_key_follows_replace() -> None:
+    setting = ParameterSetting("P45", "Spannung", None, "#123456", visible=True)
+    assert setting.sort_key == ("Allgemein", "Spannung")
+    assert replace(setting, unit="V").sort_key == ("V", "Spannung")
+    assert replace(setting, visible=False) == replace(setting, visible=False)
+
+
+def test_parameter_row_toggle_mutates_setting(qapp) -> None:
+    del qapp
+    setting = ParameterSetting("P45", "Spannung", "V", "#123456", visible=True)
+    row = ParameterRow(setting, None)
+    emitted = []
+    row.changed.connect(emitted.append)
+    try:
+        row._visible_box.setChecked(False)
+        row.set_color("#abcdef")
+        assert row.setting() is setting
+        assert emitted == [setting]
+        assert setting.visible is False
+        assert setting.color == "#abcdef"
+    finally:
+        row.deleteLater()
+
+
+def test_meta_panel_updates_fields_in_place(qapp) -> None:
+    del qapp
+    panel = MetaDetailPanel()
+    try:
+        panel.update_meta({}, None, None)
+        assert panel._scroll is None
+        panel.update_meta({"P70": "12"}, 5, StatusDetail(raw_value=5, badges=[], details=["A: b"]))
+        caption, field = panel._field_rows["P70"]
+        assert panel._status_row[1].text() == "A: b"
+
+        panel.update_meta({"P70": "13", "P71": "2"}, 5, None)
+        assert panel._field_rows["P70"] == (caption, field)
+        assert field.text().startswith("13")
+        assert panel._status_row[1].text() == "Keine Statusinformationen verfügbar."
+
+        panel.update_meta({"P71": "2"}, None, None)
+        assert field.isHidden()
+    finally:
+        panel.deleteLater()
+
+
+def test_sidebar_width_updates_are_coalesced(qapp) -> None:
+    sidebar = ParameterSidebar()
+    emitted: list[int] = []
+    try:
+        qapp.processEvents()
+        sidebar.preferred_width_changed.connect(emitted.append)
+        long = ParameterSetting("P41", "Sehr langer Parametername zur Breitenmessung", "mV", "#654321", True)
+        sidebar.populate([long])
+        sidebar.populate([long])
+        assert emitted == []
+
+        qapp.processEvents()
+        assert emitted == [sidebar.preferred_width()]
+    finally:
+        sidebar.deleteLater()
+
+
+def test_status_badges_are_recycled(qapp) -> None:
+    del qapp
+    bar = StatusBadgeBar(AppConfig())
+    try:
+        bar.update_state({}, StatusDetail(raw_value=1, badges=["A: 1", "B: 2"], details=[]))
+        first, second = bar._badges
+
+        bar.update_state({}, StatusDetail(raw_value=2, badges=["C: 3"], details=[]))
+        assert bar._badges == [first, second]
+        assert first.objectName() == "statusBadge" and first.styleSheet() == ""
+        assert first.text() == "C: 3"
+        assert second.isHidden()
+
+        first.setText("stale")
+        bar.update_state({}, StatusDetail(raw_value=3, badges=["C: 3"], details=[]))
+        assert first.text() == "stale"
+    finally:
+        bar.deleteLater()
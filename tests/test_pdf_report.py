@@ -29,6 +29,7 @@ try:  # pragma: no cover - Abhängigkeiten fehlen ggf. im CI
 except ImportError as exc:  # pragma: no cover
     pytest.skip(f"UI-Komponenten nicht verfügbar: {exc}", allow_module_level=True)
 
+from wtc3_logger.ui import pdf_report
 from wtc3_logger.ui.pdf_report import ParameterSeries, ParameterStatistic, StatusMarker, render_measurement_report
 
 
@@ -68,28 +69,41 @@ def test_render_measurement_report_creates_pdf(tmp_path, qapp):
     ]
     markers = [StatusMarker(position=60.0, label="Batteriespannung: Tief -> Normal")]
 
-    render_measurement_report(
-        target,
-        meta,
-        31248,
-        status_detail,
-        meta["P04"],
-        "CC-CV",
-        visible_stats,
-        [],
-        series,
-        markers,
-        sample_count=3,
-        duration_seconds=125.5,
-        x_axis_caption="P06 – Laufzeit",
-        x_axis_unit="s",
-        start_x=0.0,
-        end_x=125.5,
-        generated_at=datetime(2023, 1, 1, 12, 0, 0),
-    )
+    def render(path):
+        render_measurement_report(
+            path,
+            meta,
+            31248,
+            status_detail,
+            meta["P04"],
+            "CC-CV",
+            visible_stats,
+            [],
+            series,
+            markers,
+            sample_count=3,
+            duration_seconds=125.5,
+            x_axis_caption="P06 – Laufzeit",
+            x_axis_unit="s",
+            start_x=0.0,
+            end_x=125.5,
+            generated_at=datetime(2023, 1, 1, 12, 0, 0),
+        )
 
-    assert target.exists()
-    assert target.read_bytes().startswith(b"%PDF")
+    try:
+        render(target)
+        assert target.exists()
+        assert target.read_bytes().startswith(b"%PDF")
+
+        # Weitere Exporte im selben Thread verwenden den laufenden Browser.
+        browser = pdf_report._RENDERER.browser
+        second = tmp_path / "protokoll_2.pdf"
+        render(second)
+        assert pdf_report._RENDERER.browser is browser
+        assert second.read_bytes().startswith(b"%PDF")
+    finally:
+        pdf_report.close_report_renderer()
+    assert pdf_report._RENDERER.browser is None
 
 
 def test_parameter_sidebar_adjusts_width(tmp_path, qapp):
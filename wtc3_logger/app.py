@@ -11,7 +11,6 @@ from PySide6 import QtWidgets, QtGui
 from .acquisition import AcquisitionController
 from .config import AppConfig, DEFAULT_CONFIG, SerialConfig
 from .databus import DataBus
-from .ui import MainWindow
 
 
 
@@ -62,6 +61,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     controller = AcquisitionController(config, databus)
 
     app = QtWidgets.QApplication(sys.argv)
+    # pyqtgraph und das Hauptfenster erst laden, wenn Argumente und Konfiguration
+    # gültig sind; ``--help`` und Fehler in der YAML kommen so ohne Wartezeit.
+    from .ui import MainWindow
+
     icon_path = _resource_path("assets", "Icon.png")
     if icon_path.exists():
         app.setWindowIcon(QtGui.QIcon(str(icon_path)))
@@ -39,6 +39,10 @@ class AppConfig:
     max_points: int = 10_000
     status_bits: dict[int, str] = field(default_factory=dict)
     strategy_labels: dict[str, str] = field(default_factory=dict)
+    # Statistik ausgeblendeter Parameter im PDF-Bericht (Abschnitt "Additional Parameters").
+    include_hidden_stats: bool = False
+    # OpenGL-Rendering der Plots; nur auf Wunsch und mit installiertem Extra "opengl".
+    use_opengl: bool = False
 
     def resolved_sample(self) -> Optional[Path]:
         return self.sample_file
@@ -81,6 +85,8 @@ class AppConfig:
             max_points=int(data.get("max_points", 10_000)),
             status_bits=status_bits,
             strategy_labels=strategy_labels,
+            include_hidden_stats=bool(data.get("include_hidden_stats", False)),
+            use_opengl=bool(data.get("use_opengl", False)),
         )
 
 
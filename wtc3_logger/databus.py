@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections import deque
 from threading import Lock
-from typing import Callable, Deque, Dict, List
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from .parser import Number
 
@@ -18,11 +18,13 @@ class DataBus:
         self._listeners: List[Callable[[Dict[str, str], Dict[str, Number | str]], None]] = []
         self._lock = Lock()
         self._generation = 0
+        self._appended = 0
 
     def append(self, meta: Dict[str, str], record: Dict[str, Number | str]) -> None:
         with self._lock:
             self._meta = dict(meta)
             self._records.append(dict(record))
+            self._appended += 1
         for listener in list(self._listeners):
             listener(meta, record)
 
@@ -35,6 +37,28 @@ class DataBus:
         with self._lock:
             return list(self._records)
 
+    def snapshot_with_count(self) -> Tuple[List[Dict[str, Number | str]], int]:
+        """Return the records together with the total number of appends so far.
+
+        The counter is monotonic across resets, so consumers can tell how many
+        trailing records of the snapshot are new since their last call.
+        """
+
+        with self._lock:
+            return list(self._records), self._appended
+
+    def sample_count(self) -> int:
+        """Return the monotonic append counter without copying the records."""
+
+        with self._lock:
+            return self._appended
+
+    def latest(self) -> Optional[Dict[str, Number | str]]:
+        """Return the most recent record without copying the whole window."""
+
+        with self._lock:
+            return self._records[-1] if self._records else None
+
     def meta(self) -> Dict[str, str]:
         with self._lock:
             return dict(self._meta)
@@ -0,0 +1,140 @@
+"""Numerische Kernfunktionen für lange Messreihen.
+
+Die Funktionen arbeiten auf NumPy-Arrays und werden mit Numba kompiliert,
+sofern das Paket installiert ist. Ohne Numba laufen dieselben Schleifen als
+reines Python.
+"""
+from __future__ import annotations
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - optionale Abhängigkeit
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore
+
+HAVE_NUMBA = njit is not None
+
+
+def _jit(fastmath: bool = False) -> Callable[[Callable], Callable]:
+    if njit is None:
+        return lambda fn: fn
+    return njit(cache=True, fastmath=fastmath)
+
+
+# Ohne fastmath, damit die Prüfung auf endliche Werte erhalten bleibt.
+@_jit()
+def finite_stats(arr: np.ndarray) -> Tuple[float, float, float, int]:
+    """Liefert ``(min, max, last, count)`` der endlichen Einträge in einem Durchlauf.
+
+    Ohne endliche Einträge ist das Ergebnis ``(inf, -inf, nan, 0)``.
+    """
+
+    mn = np.inf
+    mx = -np.inf
+    last = np.nan
+    count = 0
+    for i in range(arr.shape[0]):
+        value = arr[i]
+        if not np.isfinite(value):
+            continue
+        if value < mn:
+            mn = value
+        if value > mx:
+            mx = value
+        last = value
+        count += 1
+    return mn, mx, last, count
+
+
+# Ohne fastmath, damit die NaN-Prüfung nicht wegoptimiert wird.
+@_jit()
+def fill_x(raw: np.ndarray, out: np.ndarray, offset: float = 0.0) -> None:
+    """Übernimmt ``raw`` nach ``out`` und ersetzt ungültige Werte durch ``offset`` plus Index."""
+
+    for i in range(raw.shape[0]):
+        value = raw[i]
+        if not np.isnan(value):
+            out[i] = value
+        else:
+            out[i] = offset + i
+
+
+@_jit()
+def _m4_flush(
+    x: np.ndarray,
+    y: np.ndarray,
+    first: int,
+    lo: int,
+    hi: int,
+    last: int,
+    out_x: np.ndarray,
+    out_y: np.ndarray,
+    count: int,
+) -> int:
+    if lo > hi:
+        lo, hi = hi, lo
+    for index in (first, lo, hi, last):
+        out_x[count] = x[index]
+        out_y[count] = y[index]
+        count += 1
+    return count
+
+
+@_jit(fastmath=True)
+def m4_bins(x: np.ndarray, y: np.ndarray, n_bins: int, out_x: np.ndarray, out_y: np.ndarray) -> int:
+    """M4-Reduktion: je Bin erster, kleinster, größter und letzter Punkt.
+
+    ``x`` muss aufsteigend sein und darf keine NaN enthalten. Liefert die Anzahl
+    geschriebener Punkte oder ``-1``, wenn ``out_x``/``out_y`` nicht ausreichen.
+    """
+
+    n = x.shape[0]
+    if n == 0 or n_bins <= 0:
+        return 0
+    span = x[n - 1] - x[0]
+    if not span > 0.0:
+        return -1
+    scale = n_bins / span
+    count = 0
+    current = -1
+    first = lo = hi = last = 0
+    for i in range(n):
+        b = int((x[i] - x[0]) * scale)
+        if b >= n_bins:
+            b = n_bins - 1
+        elif b < 0:
+            b = 0
+        if b != current:
+            if current >= 0:
+                if count + 4 > out_x.shape[0]:
+                    return -1
+                count = _m4_flush(x, y, first, lo, hi, last, out_x, out_y, count)
+            current = b
+            first = lo = hi = i
+        elif y[i] < y[lo]:
+            lo = i
+        elif y[i] > y[hi]:
+            hi = i
+        last = i
+    if count + 4 > out_x.shape[0]:
+        return -1
+    return _m4_flush(x, y, first, lo, hi, last, out_x, out_y, count)
+
+
+def warm_up() -> None:
+    """Kompiliert die Kernfunktionen vorab, damit der erste Refresh nicht stockt."""
+
+    if not HAVE_NUMBA:
+        return
+    values = np.arange(8, dtype=np.float64)
+    finite_stats(values)
+    fill_x(values, np.empty_like(values), 0.0)
+    points = values.astype(np.float32)
+    out = np.empty(8, dtype=np.float32)
+    m4_bins(points, points, 2, out, out.copy())
+
+
+__all__ = ["HAVE_NUMBA", "fill_x", "finite_stats", "m4_bins", "warm_up"]
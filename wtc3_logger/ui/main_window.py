@@ -1,24 +1,45 @@
 """Qt UI für den Telemetrie-Viewer im Wetech-Stil."""
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+import sys
+import time
 import unicodedata
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 import pyqtgraph as pg
 from PySide6 import QtCore, QtGui, QtWidgets
 
+try:  # pragma: no cover - optionale Abhängigkeit für GPU-Rendering
+    import OpenGL  # noqa: F401
+except ImportError:  # pragma: no cover
+    OpenGL = None  # type: ignore
+
 from ..acquisition import AcquisitionController
 from ..config import AppConfig
 from ..preferences import load_preferences, save_preferences
 from ..databus import DataBus
 from ..parser import PARAMETERS, Number
 from ..status import StatusDetail, decode_status, label_strategy
-from . import colors
+from . import _fast, colors
 from .config_dialog import ConfigDialog
-from .pdf_report import ParameterSeries, ParameterStatistic, StatusMarker, render_measurement_report
+from .pdf_report import (
+    CHART_PLOT_WIDTH,
+    ParameterSeries,
+    ParameterStatistic,
+    StatusMarker,
+    close_report_renderer,
+    render_measurement_report,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - erst beim ersten Export importiert
+    from concurrent.futures import Future, ThreadPoolExecutor
 
 
 SERIES_DEFAULT: List[str] = ["P44", "P45", "P54", "P55", "P61"]
@@ -55,14 +76,36 @@ STATUS_FIELD_TRANSLATIONS = {
     "nicd eoc": "NiCd End of Charge",
 }
 
+# ΔV/ΔT ergeben nach dem Zusammenfassen der Leerzeichen "Delta V"/"Delta T".
+_NORMALIZE_TABLE = str.maketrans({"\u0394": "Delta "})
+
+
+@lru_cache(maxsize=512)
 def _normalize_status_label(text: str) -> str:
-    cleaned = text.strip()
-    cleaned = cleaned.replace("\u0394", "Delta ")
-    cleaned = cleaned.replace("ΔV", "Delta V").replace("ΔT", "Delta T")
-    cleaned = cleaned.replace("Δ", "Delta ")
+    cleaned = text.strip().translate(_NORMALIZE_TABLE)
     normalized = unicodedata.normalize("NFKD", cleaned).encode("ascii", "ignore").decode("ascii")
     normalized = " ".join(normalized.split()).lower()
-    return normalized
+    return sys.intern(normalized)
+
+
+def _as_float(value: Number | str | None) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float("nan")
+
+
+# Platzhalter für nicht dekodierbare Statuswerte in Integer-Spalten.
+_NO_STATUS = int(np.iinfo(np.int64).min)
+
+
+def _status_code(value: Number | str | None) -> int:
+    """Statuswort so, wie ``decode_status`` es interpretiert, sonst ``_NO_STATUS``."""
+
+    try:
+        return int(value) if value is not None else _NO_STATUS
+    except (TypeError, ValueError):
+        return _NO_STATUS
+
 
 STATUS_VALUE_TRANSLATIONS = {
     "tiefentladen": "Deep Discharged",
@@ -98,16 +141,121 @@ STATUS_VALUE_TRANSLATIONS = {
     "hohe temperatur": "High temperature",
 }
 
+# Schlüssel und Werte sind interniert; normalisierte Eingaben aus dem
+# (ebenfalls internierten) Cache treffen so per Identitätsvergleich.
+_STATUS_FIELD_LOOKUP = {
+    _normalize_status_label(k): sys.intern(v) for k, v in STATUS_FIELD_TRANSLATIONS.items()
+}
+_STATUS_VALUE_LOOKUP = {
+    _normalize_status_label(k): sys.intern(v) for k, v in STATUS_VALUE_TRANSLATIONS.items()
+}
 
 
-
-
-
+# Stylesheets werden einmal beim Import gebaut; Qt parst jede Zuweisung neu,
+# daher sollen Widgets nur noch fertige Konstanten setzen. Was je Parameter,
+# Meta-Key oder Badge mehrfach vorkommt, hängt über den objectName am
+# Stylesheet des Containers und wird so nur einmal geparst.
+_CARD_QSS = f"QFrame {{background: white; border-radius: 12px; border: 1px solid {colors.PRIMARY_LIGHT};}}"
+_PARAMETER_ROWS_QSS = (
+    f"QWidget#parameterContent {{background: {colors.BACKGROUND};}}"
+    "QFrame#parameterRow, QFrame#parameterRow QFrame"
+    f" {{background: white; border: 1px solid {colors.PRIMARY_LIGHT}; border-radius: 8px;}}"
+    f"QFrame#parameterRow QLabel#parameterInfo {{color: {colors.TEXT}; font-weight: 500;}}"
+    f'QFrame#parameterRow QLabel#parameterInfo[state="muted"] {{color: {colors.MUTED_TEXT};}}'
+    f"QFrame#parameterRow QLabel#parameterValue {{color: {colors.PRIMARY_DARK}; font-weight: 600;"
+    f" background: {colors.BACKGROUND}; border-radius: 8px; padding: 4px 10px;}}"
+)
+# Halbtransparenter Hintergrund hinter der Konfigurationswarnung.
+_OVERLAY_BACKDROP_QSS = "QFrame#configurationWarningOverlay {background: rgba(255, 255, 255, 210);}"
+_OVERLAY_PANEL_QSS = (
+    f"QFrame {{background: {colors.BACKGROUND}; border: 2px solid {colors.ACCENT};"
+    " border-radius: 14px; padding: 26px 36px;}"
+)
+_OVERLAY_TITLE_QSS = f"QLabel {{color: {colors.ACCENT}; font-size: 20px; font-weight: 600;}}"
+_OVERLAY_MESSAGE_QSS = f"QLabel {{color: {colors.TEXT}; font-size: 13px;}}"
+_OVERLAY_HINT_QSS = f"QLabel {{color: {colors.MUTED_TEXT};}}"
+_SIDEBAR_TOGGLE_QSS = f"QToolButton {{color: {colors.PRIMARY}; font-weight: 600; border: none;}}"
+_SECTION_HEADER_QSS = f"QLabel {{color: {colors.PRIMARY_DARK}; font-size: 15px; font-weight: 600;}}"
+_UNIT_HEADER_QSS = f"QLabel {{color: {colors.MUTED_TEXT}; font-size: 13px; font-weight: 600;}}"
+_WINDOW_HEADER_QSS = f"font-size: 28px; font-weight: 600; color: {colors.PRIMARY}; letter-spacing: 0.5px;"
+_TOOLBAR_QSS = (
+    f"QToolBar {{background: {colors.PRIMARY_DARK}; spacing: 12px;}}"
+    f" QToolButton {{color: white; background: {colors.PRIMARY}; border-radius: 6px; padding: 6px 12px;}}"
+)
+_TOOLBAR_CHECKBOX_QSS = "QCheckBox { color: white; font-weight: 500; }"
+_STATUS_BAR_QSS = f"color: {colors.MUTED_TEXT}"
+_FALLBACK_PALETTE = (
+    colors.PRIMARY,
+    colors.SECONDARY,
+    colors.ACCENT,
+    colors.SECONDARY_LIGHT,
+    colors.PRIMARY_LIGHT,
+    colors.TEXT,
+)
+_PLOT_TITLE_STYLE = {"color": colors.PRIMARY_DARK, "size": "12pt", "bold": True}
+_META_TITLE_QSS = f"QLabel {{color: {colors.PRIMARY_DARK}; font-size: 18px; font-weight: 600;}}"
+_META_SUBTITLE_QSS = f"QLabel {{color: {colors.MUTED_TEXT}; font-size: 13px;}}"
+_META_PLACEHOLDER_QSS = f"QLabel {{color: {colors.MUTED_TEXT}; font-style: italic;}}"
+_META_CONTENT_QSS = (
+    f"QGroupBox#metaGroup {{border: 1px solid {colors.PRIMARY_LIGHT}; border-radius: 10px; margin-top: 12px;"
+    " padding: 10px 12px;}"
+    "QGroupBox#metaGroup::title {subcontrol-origin: margin; left: 12px; padding: 0 4px;"
+    f" color: {colors.PRIMARY_DARK}; font-weight: 600;}}"
+    f"QLabel#metaCaption {{color: {colors.TEXT}; font-weight: 500;}}"
+    f"QLineEdit#metaField {{background: {colors.BACKGROUND}; border: 1px solid {colors.PRIMARY_LIGHT};"
+    " border-radius: 6px; padding: 6px 8px;}"
+)
+_META_STATUS_QSS = (
+    f"QLabel {{background: white; border: 1px solid {colors.PRIMARY_LIGHT}; border-radius: 6px;"
+    f" padding: 6px 8px; color: {colors.TEXT};}}"
+)
+_BADGE_BAR_QSS = (
+    f"QLabel#strategyBadge {{background: {colors.PRIMARY}; color: white; border-radius: 14px;"
+    " padding: 6px 12px; font-weight: 600;}"
+    f"QLabel#statusBadge {{background: {colors.PRIMARY_DARK}; color: white; border-radius: 12px;"
+    " padding: 4px 10px; font-weight: 500;}"
+)
+
+
+# Ein Stift/Pinsel je Farbe wird von allen Kurven und Farbfeldern geteilt und
+# darf deshalb nicht verändert werden.
+@lru_cache(maxsize=256)
+def _pen_for(color_hex: str, width: int = 2) -> QtGui.QPen:
+    return pg.mkPen(color_hex, width=width)
+
+
+@lru_cache(maxsize=256)
+def _brush_for(color_hex: str) -> QtGui.QBrush:
+    return pg.mkBrush(color_hex)
+
+
+@lru_cache(maxsize=1)
+def _fixed_font_and_width() -> Tuple[QtGui.QFont, int]:
+    """Monospace-Schrift und Mindestbreite der Wertanzeige, einmal pro Prozess ermittelt."""
+
+    font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont)
+    width = QtGui.QFontMetrics(font).horizontalAdvance('9999.999 XXX') + 12
+    return font, width
+
+
+_NBSP = '\u00A0'
+_NBSP_TABLE = str.maketrans(' ', _NBSP)
+
+
+@lru_cache(maxsize=64)
+def _unit_block(unit: str | None) -> str:
+    """Einheit auf drei Zeichen rechtsbündig, mit geschützten Leerzeichen."""
+
+    return (unit or '')[:3].rjust(3).translate(_NBSP_TABLE)
 
 
 @dataclass(slots=True)
 class ParameterSetting:
-    """Konfiguration für einen Telemetrie-Parameter."""
+    """Konfiguration für einen Telemetrie-Parameter.
+
+    Hauptfenster und Sidebar-Zeile teilen sich dieselbe Instanz;
+    ``visible`` und ``color`` werden an Ort und Stelle geändert.
+    """
 
     key: str
     label: str
@@ -115,6 +263,11 @@ class ParameterSetting:
     color: str
     visible: bool
     allow_graph: bool = True
+    sort_key: Tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Reihenfolge in der Sidebar: erst Einheit, dann Bezeichnung.
+        self.sort_key = (self.unit or "Allgemein", self.label)
 
 
 class ColorIndicator(QtWidgets.QFrame):
@@ -126,19 +279,20 @@ class ColorIndicator(QtWidgets.QFrame):
         super().__init__(parent)
         self._color = QtGui.QColor(color)
         self.setFixedSize(18, 18)
-        self._apply_style()
 
-    def _apply_style(self) -> None:
-        self.setStyleSheet(
-            "QFrame {border-radius: 9px; border: 2px solid %s; background-color: %s;}"
-            % (colors.PRIMARY_LIGHT, self._color.name())
-        )
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(_pen_for(colors.PRIMARY_LIGHT))
+        painter.setBrush(_brush_for(self._color.name()))
+        painter.drawEllipse(QtCore.QRectF(self.rect()).adjusted(1, 1, -1, -1))
+        painter.end()
 
     def set_color(self, color: QtGui.QColor) -> None:
         if not color.isValid():
             return
-        self._color = color
-        self._apply_style()
+        self._color = QtGui.QColor(color)
+        self.update()
 
     def color(self) -> QtGui.QColor:
         return QtGui.QColor(self._color)
@@ -167,12 +321,10 @@ class ParameterRow(QtWidgets.QWidget):
         else:
             self._on_color_change = on_color_change
 
+        # Das Aussehen kommt aus _PARAMETER_ROWS_QSS der Sidebar.
         container = QtWidgets.QFrame()
+        container.setObjectName("parameterRow")
         container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        container.setStyleSheet(
-            "QFrame {background: %s; border: 1px solid %s; border-radius: 8px;}"
-            % ("white", colors.PRIMARY_LIGHT)
-        )
         layout = QtWidgets.QHBoxLayout(container)
         layout.setContentsMargins(10, 6, 10, 6)
         layout.setSpacing(8)
@@ -183,24 +335,16 @@ class ParameterRow(QtWidgets.QWidget):
         self._visible_box.toggled.connect(self._emit_change)
         layout.addWidget(self._visible_box)
 
-        unit = f" [{setting.unit}]" if setting.unit else ""
-        self._info_label = QtWidgets.QLabel(f"{setting.key} – {setting.label}{unit}")
-        self._info_label.setStyleSheet(
-            "QLabel {color: %s; font-weight: 500;}" % colors.TEXT
-        )
+        self._info_label = QtWidgets.QLabel(self._info_text(setting))
+        self._info_label.setObjectName("parameterInfo")
         layout.addWidget(self._info_label, 1)
 
         self._value_label = QtWidgets.QLabel('---.---   ')
         self._value_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
-        fixed_font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        fixed_font, value_width = _fixed_font_and_width()
         self._value_label.setFont(fixed_font)
-        metrics = QtGui.QFontMetrics(fixed_font)
-        sample_width = metrics.horizontalAdvance('9999.999 XXX')
-        self._value_label.setMinimumWidth(sample_width + 12)
-        self._value_label.setStyleSheet(
-            "QLabel {color: %s; font-weight: 600; background: %s; border-radius: 8px; padding: 4px 10px;}"
-            % (colors.PRIMARY_DARK, colors.BACKGROUND)
-        )
+        self._value_label.setMinimumWidth(value_width)
+        self._value_label.setObjectName("parameterValue")
         self._value_label.setText(self._value_label.text().replace(' ', '\u00A0'))
         layout.addWidget(self._value_label)
 
@@ -216,9 +360,29 @@ class ParameterRow(QtWidgets.QWidget):
 
         self._update_enabled_state()
 
+    @staticmethod
+    def _info_text(setting: ParameterSetting) -> str:
+        unit = f" [{setting.unit}]" if setting.unit else ""
+        return f"{setting.key} – {setting.label}{unit}"
+
+    def apply_setting(self, setting: ParameterSetting) -> None:
+        """Übernimmt eine geänderte Einstellung, ohne die Zeile neu aufzubauen."""
+
+        previous = self._setting
+        self._setting = setting
+        if (setting.key, setting.label, setting.unit) != (previous.key, previous.label, previous.unit):
+            self._info_label.setText(self._info_text(setting))
+        if setting.color != previous.color:
+            self._color_indicator.set_color(QtGui.QColor(setting.color))
+        if self._visible_box.isChecked() != setting.visible:
+            self._visible_box.blockSignals(True)
+            self._visible_box.setChecked(setting.visible)
+            self._visible_box.blockSignals(False)
+        self._update_enabled_state()
+
     def set_color(self, color_hex: str) -> None:
         self._color_indicator.set_color(QtGui.QColor(color_hex))
-        self._setting = replace(self._setting, color=color_hex)
+        self._setting.color = color_hex
 
     def _open_color_dialog(self) -> None:
         current = self._color_indicator.color()
@@ -233,24 +397,22 @@ class ParameterRow(QtWidgets.QWidget):
     def setting(self) -> ParameterSetting:
         return self._setting
 
+    @QtCore.Slot()
     def _emit_change(self) -> None:
-        visible = self._visible_box.isChecked()
-        self._setting = replace(
-            self._setting,
-            visible=visible,
-        )
+        # Die Zeile hält dieselbe Instanz wie das Hauptfenster; die Änderung
+        # wird per Referenz über ``changed`` weitergereicht.
+        self._setting.visible = self._visible_box.isChecked()
         self._update_enabled_state()
         self.changed.emit(self._setting)
 
     def _update_enabled_state(self) -> None:
-        if self._visible_box.isChecked():
-            self._info_label.setStyleSheet(
-                "QLabel {color: %s; font-weight: 500;}" % colors.TEXT
-            )
-        else:
-            self._info_label.setStyleSheet(
-                "QLabel {color: %s; font-weight: 500;}" % colors.MUTED_TEXT
-            )
+        state = "active" if self._visible_box.isChecked() else "muted"
+        if self._info_label.property("state") == state:
+            return
+        self._info_label.setProperty("state", state)
+        style = self._info_label.style()
+        style.unpolish(self._info_label)
+        style.polish(self._info_label)
 
     def update_value(self, display_value: str) -> None:
         self._value_label.setText(display_value.replace(' ', '\u00A0'))
@@ -264,57 +426,88 @@ class ConfigurationWarningOverlay(QtWidgets.QFrame):
     def __init__(self, parent: QtWidgets.QWidget) -> None:
         super().__init__(parent)
         self.setObjectName("configurationWarningOverlay")
-        self.setStyleSheet(
-            "QFrame#configurationWarningOverlay {background: rgba(255, 255, 255, 210);}"  # translucent backdrop
-        )
+        self.setStyleSheet(_OVERLAY_BACKDROP_QSS)
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self._layout = QtWidgets.QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # Der Inhalt entsteht erst beim ersten set_message; meist bleibt die
+        # Warnung verborgen.
+        self._message: QtWidgets.QLabel | None = None
+        self.hide()
+
+    def _ensure_built(self) -> QtWidgets.QLabel:
+        if self._message is not None:
+            return self._message
 
         panel = QtWidgets.QFrame()
-        panel.setStyleSheet(
-            "QFrame {background: %s; border: 2px solid %s; border-radius: 14px; padding: 26px 36px;}"
-            % (colors.BACKGROUND, colors.ACCENT)
-        )
+        panel.setStyleSheet(_OVERLAY_PANEL_QSS)
         inner = QtWidgets.QVBoxLayout(panel)
         inner.setSpacing(12)
         inner.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         title = QtWidgets.QLabel("Configuration incomplete")
         title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet(
-            "QLabel {color: %s; font-size: 20px; font-weight: 600;}" % colors.ACCENT
-        )
+        title.setStyleSheet(_OVERLAY_TITLE_QSS)
         inner.addWidget(title)
 
         self._message = QtWidgets.QLabel()
         self._message.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self._message.setWordWrap(True)
-        self._message.setStyleSheet(
-            "QLabel {color: %s; font-size: 13px;}" % colors.TEXT
-        )
+        self._message.setStyleSheet(_OVERLAY_MESSAGE_QSS)
         inner.addWidget(self._message)
 
         hint = QtWidgets.QLabel("Open the data source settings to select a COM port or sample file.")
         hint.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         hint.setWordWrap(True)
-        hint.setStyleSheet("QLabel {color: %s;}" % colors.MUTED_TEXT)
+        hint.setStyleSheet(_OVERLAY_HINT_QSS)
         inner.addWidget(hint)
 
-        layout.addWidget(panel)
-        self.hide()
+        self._layout.addWidget(panel)
+        return self._message
 
     def set_message(self, message: str) -> None:
-        self._message.setText(message)
+        self._ensure_built().setText(message)
 
     def update_geometry(self) -> None:
         if self.parent() is not None:
             self.setGeometry(self.parent().rect())
 
+class _SidebarGroup(QtWidgets.QWidget):
+    """Überschrift mit Inhalt; bleibt über mehrere ``populate``-Aufrufe erhalten."""
+
+    def __init__(self, title: str, style: str, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+        header = QtWidgets.QLabel(title)
+        header.setStyleSheet(style)
+        layout.addWidget(header)
+        self._body = QtWidgets.QVBoxLayout()
+        self._body.setContentsMargins(0, 0, 0, 0)
+        self._body.setSpacing(6)
+        layout.addLayout(self._body)
+        self._items: List[QtWidgets.QWidget] = []
+        self.hide()
+
+    def set_items(self, widgets: List[QtWidgets.QWidget]) -> None:
+        """Ordnet die Kind-Widgets nur neu an, wenn sich die Reihenfolge ändert."""
+
+        if widgets != self._items:
+            for widget in self._items:
+                self._body.removeWidget(widget)
+            for widget in widgets:
+                self._body.addWidget(widget)
+            self._items = list(widgets)
+        self.setVisible(bool(widgets))
+
+
 class ParameterSidebar(QtWidgets.QWidget):
     """Zusammenklappbare Sidebar zur Parameterauswahl."""
 
+    SECTION_TITLES = ("Aktive Parameter", "Weitere Parameter")
+
     changed = QtCore.Signal(str, ParameterSetting)
     preferred_width_changed = QtCore.Signal(int)
 
@@ -329,8 +522,21 @@ class ParameterSidebar(QtWidgets.QWidget):
         else:
             self._on_color_change = on_color_change
         self._rows: Dict[str, ParameterRow] = {}
+        # Reihenfolge und Sektion je Key, wie sie zuletzt angeordnet wurden.
+        self._placement: Tuple[Tuple[str, bool], ...] = ()
+        self._placed_visible: Dict[str, bool] = {}
         self._values: Dict[str, str] = {}
+        self._dirty: set[str] = set()
         self._preferred_width: int = 360
+        self._width_pending = False
+        self._width_force = False
+
+        # Werte werden gesammelt und höchstens ~30x pro Sekunde in die Labels geschrieben.
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self._flush_timer.timeout.connect(self._flush)
 
         self.setAutoFillBackground(True)
         palette = self.palette()
@@ -347,9 +553,7 @@ class ParameterSidebar(QtWidgets.QWidget):
         self._toggle.setChecked(True)
         self._toggle.setArrowType(QtCore.Qt.ArrowType.DownArrow)
         self._toggle.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        self._toggle.setStyleSheet(
-            "QToolButton {color: %s; font-weight: 600; border: none;}" % colors.PRIMARY
-        )
+        self._toggle.setStyleSheet(_SIDEBAR_TOGGLE_QSS)
         self._toggle.toggled.connect(self._toggle_sidebar)
         layout.addWidget(self._toggle)
 
@@ -359,64 +563,109 @@ class ParameterSidebar(QtWidgets.QWidget):
         layout.addWidget(self._scroll, 1)
 
         self._scroll_content = QtWidgets.QWidget()
+        self._scroll_content.setObjectName("parameterContent")
+        self._scroll_content.setStyleSheet(_PARAMETER_ROWS_QSS)
         self._scroll_layout = QtWidgets.QVBoxLayout(self._scroll_content)
         self._scroll_layout.setContentsMargins(0, 0, 0, 0)
         self._scroll_layout.setSpacing(6)
+        self._sections: Dict[str, _SidebarGroup] = {}
+        for title in self.SECTION_TITLES:
+            section = _SidebarGroup(title, _SECTION_HEADER_QSS, self._scroll_content)
+            self._sections[title] = section
+            self._scroll_layout.addWidget(section)
+        self._unit_blocks: Dict[Tuple[str, str], _SidebarGroup] = {}
         self._scroll_layout.addStretch(1)
         self._scroll.setWidget(self._scroll_content)
 
         self._update_dynamic_width(force=True)
 
     def populate(self, settings: Iterable[ParameterSetting]) -> None:
-        # Entferne Platzhalter-Stretch, damit neue Elemente korrekt eingefügt werden.
-        while self._scroll_layout.count():
-            item = self._scroll_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        self._rows.clear()
+        """Gleicht die Zeilen mit ``settings`` ab.
 
-        settings_list = list(settings)
-        active = [s for s in settings_list if s.visible]
-        inactive = [s for s in settings_list if not s.visible]
+        Bestehende Zeilen werden wiederverwendet und nur bei Änderungen
+        aktualisiert; neu gebaut werden ausschließlich Zeilen für neue Keys.
+        """
 
-        self._add_section("Aktive Parameter", active)
-        self._add_section("Weitere Parameter", inactive)
+        settings_list = sorted(settings, key=attrgetter("sort_key"))
+        incoming = {setting.key: setting for setting in settings_list}
 
-        self._scroll_layout.addStretch(1)
+        placement = tuple((setting.key, setting.visible) for setting in settings_list)
+        changed = False
 
-        self._update_dynamic_width()
+        # Alle Zeilenänderungen landen in einem einzigen Repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            for key in [key for key in self._rows if key not in incoming]:
+                self._rows.pop(key).deleteLater()
+                changed = True
 
-    def _add_section(self, title: str, entries: List[ParameterSetting]) -> None:
-        if not entries:
-            return
-        header = QtWidgets.QLabel(title)
-        header.setStyleSheet(
-            "QLabel {color: %s; font-size: 15px; font-weight: 600;}" % colors.PRIMARY_DARK
-        )
-        self._scroll_layout.addWidget(header)
+            for setting in settings_list:
+                row = self._rows.get(setting.key)
+                if row is None:
+                    row = ParameterRow(setting, self._on_color_change)
+                    row.changed.connect(self._on_row_changed)
+                    self._rows[setting.key] = row
+                    self._apply_value_to_row(setting.key)
+                    changed = True
+                # Toggle und Farbwahl ändern die gemeinsame Instanz bereits in
+                # der Zeile; der Vergleich greift nur bei neuen Instanzen.
+                elif row.setting() != setting:
+                    row.apply_setting(setting)
+                    changed = True
+
+            # Sektionen nur neu ordnen, wenn sich Reihenfolge oder Sichtbarkeit ändern.
+            if placement != self._placement:
+                active_title, inactive_title = self.SECTION_TITLES
+                self._fill_section(active_title, [s for s in settings_list if s.visible])
+                self._fill_section(inactive_title, [s for s in settings_list if not s.visible])
+                self._placement = placement
+                self._placed_visible = dict(placement)
+                changed = True
+        finally:
+            self.setUpdatesEnabled(True)
 
-        grouped: Dict[str, list[ParameterSetting]] = {}
-        for setting in entries:
-            grouped.setdefault(setting.unit or "Allgemein", []).append(setting)
+        if changed:
+            self._update_dynamic_width()
 
-        for unit, unit_entries in sorted(grouped.items(), key=lambda kv: kv[0]):
-            unit_label = QtWidgets.QLabel(unit)
-            unit_label.setStyleSheet(
-                "QLabel {color: %s; font-size: 13px; font-weight: 600;}" % colors.MUTED_TEXT
-            )
-            self._scroll_layout.addWidget(unit_label)
-            for setting in sorted(unit_entries, key=lambda s: s.label):
-                row = ParameterRow(setting, self._on_color_change)
-                row.changed.connect(self._on_row_changed)
-                self._scroll_layout.addWidget(row)
-                self._rows[setting.key] = row
-                self._apply_value_to_row(setting.key)
+    def update_row(self, setting: ParameterSetting) -> bool:
+        """Aktualisiert eine bestehende Zeile an Ort und Stelle.
+
+        Liefert ``False``, wenn die Zeile fehlt oder die Sektion wechseln
+        müsste; dann ist ``populate`` nötig.
+        """
+
+        row = self._rows.get(setting.key)
+        if row is None or self._placed_visible.get(setting.key) != setting.visible:
+            return False
+        row.apply_setting(setting)
+        return True
+
+    def _fill_section(self, title: str, entries: List[ParameterSetting]) -> None:
+        # ``entries`` ist bereits nach ``sort_key`` sortiert, die Gruppen entstehen
+        # daher in einem Durchlauf in der richtigen Reihenfolge.
+        grouped: Dict[str, List[QtWidgets.QWidget]] = {}
+        for setting in entries:
+            grouped.setdefault(setting.sort_key[0], []).append(self._rows[setting.key])
+
+        blocks: List[QtWidgets.QWidget] = []
+        for unit, rows in grouped.items():
+            block = self._unit_blocks.get((title, unit))
+            if block is None:
+                block = _SidebarGroup(unit, _UNIT_HEADER_QSS, self._scroll_content)
+                self._unit_blocks[(title, unit)] = block
+            block.set_items(rows)
+            blocks.append(block)
+
+        for (section, unit), block in self._unit_blocks.items():
+            if section == title and unit not in grouped:
+                block.set_items([])
+        self._sections[title].set_items(blocks)
 
     def setting(self, key: str) -> ParameterSetting | None:
         row = self._rows.get(key)
         return row.setting() if row else None
 
+    @QtCore.Slot(ParameterSetting)
     def _on_row_changed(self, setting: ParameterSetting) -> None:
         self.changed.emit(setting.key, setting)
 
@@ -436,7 +685,18 @@ class ParameterSidebar(QtWidgets.QWidget):
             self.preferred_width_changed.emit(collapsed)
 
     def _update_dynamic_width(self, force: bool = False) -> None:
-        self._scroll_content.adjustSize()
+        """Plant die Breitenberechnung; mehrere Anfragen pro Event-Loop-Durchlauf laufen einmal."""
+
+        self._width_force = self._width_force or force
+        if self._width_pending:
+            return
+        self._width_pending = True
+        QtCore.QTimer.singleShot(0, self, self._do_update_dynamic_width)
+
+    def _do_update_dynamic_width(self) -> None:
+        force, self._width_force = self._width_force, False
+        self._width_pending = False
+        # sizeHint kommt aus dem Layout-Cache; adjustSize würde das Layout erzwingen.
         content_width = self._scroll_content.sizeHint().width()
         scrollbar_width = self._scroll.verticalScrollBar().sizeHint().width()
         preferred = content_width + scrollbar_width + 24
@@ -461,14 +721,39 @@ class ParameterSidebar(QtWidgets.QWidget):
         return self._toggle.isChecked()
 
     def update_value(self, key: str, value: Number | str | None, unit: str | None) -> None:
+        """Merkt den Wert vor; die Zeile wird beim nächsten Flush aktualisiert."""
+
         formatted = self._format_value(value, unit)
+        if self._values.get(key) == formatted:
+            return
         self._values[key] = formatted
-        row = self._rows.get(key)
-        if row:
-            row.update_value(formatted)
+        self._dirty.add(key)
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush(self) -> None:
+        dirty, self._dirty = self._dirty, set()
+        # Kein setUpdatesEnabled hier: das Wiedereinschalten würde die ganze
+        # Sidebar neu zeichnen, setText invalidiert nur das eigene Label.
+        for key in dirty:
+            row = self._rows.get(key)
+            value = self._values.get(key)
+            if row and value is not None:
+                row.update_value(value)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._dirty:
+            self._flush_timer.start()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:  # noqa: N802
+        self._flush_timer.stop()
+        super().hideEvent(event)
 
     def clear_values(self) -> None:
         self._values.clear()
+        self._dirty.clear()
         for row in self._rows.values():
             placeholder = self._format_value(None, row.setting().unit)
             row.update_value(placeholder)
@@ -481,6 +766,7 @@ class ParameterSidebar(QtWidgets.QWidget):
 
     def forget_value(self, key: str) -> None:
         self._values.pop(key, None)
+        self._dirty.discard(key)
 
     def _apply_value_to_row(self, key: str) -> None:
         row = self._rows.get(key)
@@ -492,54 +778,410 @@ class ParameterSidebar(QtWidgets.QWidget):
         row.update_value(value)
 
     def _format_value(self, value: Number | str | None, unit: str | None) -> str:
-        def _nb(text: str) -> str:
-            return text.replace(' ', '\u00A0')
-
         if value is None:
             numeric = '---.---'
         elif isinstance(value, (int, float)):
-            numeric = f"{float(value):7.3f}"
+            numeric = format(float(value), '7.3f').translate(_NBSP_TABLE)
+        else:
+            numeric = str(value)[:7].rjust(7).translate(_NBSP_TABLE)
+        return f"{numeric}{_NBSP}{_unit_block(unit)}"
+
+
+class CurveBuffer:
+    """Vorallokierter ``float32``-Puffer für die Kurvendaten eines Parameters.
+
+    Neue Samples werden hinter den Schreibindex kopiert. Die Kapazität startet
+    klein und verdoppelt sich bis ``window * growth``; ist sie erreicht, wird
+    nur das sichtbare Fenster an den Anfang zurückgeschoben. Zu jedem Sample
+    wird die laufende Nummer seines Records gespeichert, damit ``trim`` den
+    Puffer an den Snapshot des DataBus binden kann. ``view`` liefert Sichten
+    ohne Kopie für ``setData``, bei Bedarf M4-reduziert.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, window: int, growth: int = 4) -> None:
+        self._window = max(1, int(window))
+        self._limit = self._window * max(2, growth)
+        capacity = min(self._INITIAL_CAPACITY, self._limit)
+        self._x = np.empty(capacity, dtype=np.float32)
+        self._y = np.empty(capacity, dtype=np.float32)
+        self._rows = np.empty(capacity, dtype=np.int64)
+        self._begin = 0
+        self._size = 0
+        # Zählt Änderungen, damit unveränderte Kurven kein setData bekommen.
+        self.version = 0
+        self._m4_x = np.empty(0, dtype=np.float32)
+        self._m4_y = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._size - self._begin
+
+    def clear(self) -> None:
+        self._begin = self._size = 0
+        self.version += 1
+
+    def extend(self, xs: np.ndarray, ys: np.ndarray, rows: np.ndarray) -> None:
+        """Hängt gültige Samples mit ihren Record-Nummern an.
+
+        Die Umwandlung nach ``float32`` passiert nur hier.
+        """
+
+        count = len(xs)
+        if count == 0:
+            return
+        if count > self._window:
+            xs = xs[-self._window:]
+            ys = ys[-self._window:]
+            rows = rows[-self._window:]
+            count = self._window
+        if self._size + count > len(self._x):
+            keep = min(len(self), self._window)
+            start = self._size - keep
+            capacity = len(self._x)
+            while capacity < keep + count and capacity < self._limit:
+                capacity *= 2
+            capacity = min(capacity, self._limit)
+            for name in ("_x", "_y", "_rows"):
+                storage = getattr(self, name)
+                if capacity > len(storage):
+                    grown = np.empty(capacity, dtype=storage.dtype)
+                    grown[:keep] = storage[start:self._size]
+                    setattr(self, name, grown)
+                else:
+                    storage[:keep] = storage[start:self._size]
+            self._begin = 0
+            self._size = keep
+        end = self._size + count
+        self._x[self._size:end] = xs
+        self._y[self._size:end] = ys
+        self._rows[self._size:end] = rows
+        self._size = end
+        self._begin = max(self._begin, end - self._window)
+        self.version += 1
+
+    def trim(self, first_row: int) -> None:
+        """Verwirft Samples aus Records vor ``first_row``."""
+
+        cut = self._begin + int(np.searchsorted(self._rows[self._begin:self._size], first_row))
+        if cut > self._begin:
+            self._begin = cut
+            self.version += 1
+
+    def view(self, n_bins: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        xs = self._x[self._begin:self._size]
+        ys = self._y[self._begin:self._size]
+        if n_bins <= 0 or not _fast.HAVE_NUMBA or len(xs) <= 4 * n_bins:
+            return xs, ys
+        if len(self._m4_x) < 4 * n_bins:
+            self._m4_x = np.empty(4 * n_bins, dtype=np.float32)
+            self._m4_y = np.empty(4 * n_bins, dtype=np.float32)
+        count = _fast.m4_bins(xs, ys, n_bins, self._m4_x, self._m4_y)
+        if count < 0:
+            return xs, ys
+        return self._m4_x[:count], self._m4_y[:count]
+
+
+def _numeric_column(records: Sequence[Dict[str, Number | str]], key: str) -> np.ndarray:
+    """Projiziert ``key`` als ``float64``-Spalte, nicht-numerische Werte werden NaN."""
+
+    return np.fromiter(
+        (_as_float(record.get(key)) for record in records),
+        dtype=np.float64,
+        count=len(records),
+    )
+
+
+def _numeric_block(records: Sequence[Dict[str, Number | str]], keys: Sequence[str]) -> np.ndarray:
+    """Projiziert alle ``keys`` in einem Durchlauf als ``(len(keys), len(records))``-Matrix."""
+
+    flat = np.fromiter(
+        (_as_float(record.get(key)) for record in records for key in keys),
+        dtype=np.float64,
+        count=len(records) * len(keys),
+    )
+    return flat.reshape(len(records), len(keys)).T
+
+
+def _column_stats(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Liefert ``(gültig, min, max, letzter)`` je Zeile einer ``(K, N)``-Matrix mit ``N >= 1``.
+
+    Nicht endliche Einträge zählen nicht; Zeilen ohne gültigen Wert sind in
+    der ersten Rückgabe ``False`` und in den übrigen NaN.
+    """
+
+    finite = np.isfinite(block)
+    has_values = finite.any(axis=1)
+    mins = np.where(finite, block, np.inf).min(axis=1)
+    maxs = np.where(finite, block, -np.inf).max(axis=1)
+    last_index = block.shape[1] - 1 - np.argmax(finite[:, ::-1], axis=1)
+    lasts = block[np.arange(block.shape[0]), last_index]
+    for values in (mins, maxs, lasts):
+        values[~has_values] = np.nan
+    return has_values, mins, maxs, lasts
+
+
+# Der Fit läuft immer über die Stützstellen 0..n-1 und wird bei n
+# ausgewertet; die Vorhersage ist daher ein festes Skalarprodukt je Länge.
+@lru_cache(maxsize=8)
+def _extrapolation_weights(count: int, degree: int = 5) -> np.ndarray:
+    """Gewichte, mit denen ``w @ samples`` den Polynomfit bei ``count`` auswertet."""
+
+    # Wie ``Polynomial.fit`` auf [-1, 1] abbilden, damit die Matrix gut konditioniert bleibt.
+    xs = np.linspace(-1.0, 1.0, count)
+    target = 1.0 + 2.0 / (count - 1)
+    vander = np.polynomial.polynomial.polyvander(xs, degree)
+    weights = np.polynomial.polynomial.polyvander(target, degree) @ np.linalg.pinv(vander)
+    weights = weights.ravel()
+    weights.flags.writeable = False
+    return weights
+
+
+def _minmax_indices(values: np.ndarray, buckets: int) -> np.ndarray:
+    """Indizes für eine Min/Max-Dezimierung von ``values`` auf ``buckets`` Abschnitte.
+
+    Je Abschnitt gleicher Länge bleiben kleinster und größter Wert erhalten,
+    dazu erster und letzter Punkt. Das Ergebnis ist aufsteigend sortiert.
+    """
+
+    count = len(values)
+    size = count // buckets
+    end = size * buckets
+    rows = values[:end].reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    parts = [
+        np.array([0, count - 1]),
+        offsets + rows.argmin(axis=1),
+        offsets + rows.argmax(axis=1),
+    ]
+    if end < count:
+        tail = values[end:]
+        parts.append(np.array([end + tail.argmin(), end + tail.argmax()]))
+    return np.unique(np.concatenate(parts))
+
+
+class SeriesCache:
+    """Spaltenweise ``float64``-Projektion des aktuellen Snapshots.
+
+    Jede angefragte Spalte liegt in einem eigenen Array mit gemeinsamem
+    Lesefenster. ``sync`` projiziert nur die seit dem letzten Snapshot neuen
+    Records; der Speicher wächst geometrisch und wird bei Bedarf kompaktiert.
+    Für gecachte Spalten werden Minimum, Maximum, letzter Wert und Anzahl
+    gültiger Werte mitgeführt, solange herausfallende Records kein Extremum
+    enthalten.
+    """
+
+    _EMPTY_STATS: Tuple[float, float, float, int] = (np.inf, -np.inf, np.nan, 0)
+
+    def __init__(self) -> None:
+        self._records: Sequence[Dict[str, Number | str]] = ()
+        self._columns: Dict[str, np.ndarray] = {}
+        self._stats: Dict[str, Tuple[float, float, float, int] | None] = {}
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size - self._start
+
+    def holds(self, records: Sequence[Dict[str, Number | str]]) -> bool:
+        """``True``, wenn ``records`` der zuletzt synchronisierte Snapshot ist."""
+
+        return records is self._records
+
+    def clear(self) -> None:
+        self._records = ()
+        self._columns.clear()
+        self._stats.clear()
+        self._start = 0
+        self._size = 0
+
+    def sync(self, records: Sequence[Dict[str, Number | str]], fresh: int | None = None) -> None:
+        """Übernimmt ``records``; ``fresh`` neue Einträge am Ende, ``None`` baut neu auf."""
+
+        total = len(records)
+        if records is self._records and total == len(self):
+            return
+        self._records = records
+        keys = list(self._columns)
+        if fresh is None or not 0 <= fresh <= total or total - fresh > len(self):
+            self._columns.clear()
+            self._stats.clear()
+            self._start = self._size = 0
+            self.prefetch(keys)
+            return
+        if not keys:
+            self._start = self._size = 0
+            return
+        evicted = len(self) + fresh - total
+        if evicted:
+            for key, storage in self._columns.items():
+                self._evict_stats(key, storage[self._start:self._start + evicted])
+        self._reserve(total - fresh, fresh)
+        block = _numeric_block(records[total - fresh:], keys)
+        end = self._size + fresh
+        for index, key in enumerate(keys):
+            self._columns[key][self._size:end] = block[index]
+            self._append_stats(key, block[index])
+        self._size = end
+        self._start = end - total
+
+    def stats(self, keys: Sequence[str]) -> Dict[str, Tuple[float, float, float]]:
+        """Liefert ``(min, max, letzter)`` der endlichen Werte je Key.
+
+        Keys ohne gültigen Wert fehlen im Ergebnis. Mitgeführte Werte werden
+        direkt übernommen, alle übrigen Spalten in einem Block reduziert.
+        """
+
+        result: Dict[str, Tuple[float, float, float]] = {}
+        missing: List[str] = []
+        for key in keys:
+            state = self._stats.get(key)
+            if state is None:
+                missing.append(key)
+            elif state[3]:
+                result[key] = state[:3]
+        if not missing or not self._records:
+            return result
+        block = self.block(missing)
+        if _fast.HAVE_NUMBA:
+            # Ein kompilierter Durchlauf je Zeile statt mehrerer NumPy-Reduktionen.
+            states = [_fast.finite_stats(row) for row in block]
         else:
-            text = str(value)
-            numeric = text[:7].rjust(7)
+            has_values, mins, maxs, lasts = _column_stats(block)
+            counts = np.count_nonzero(np.isfinite(block), axis=1)
+            states = [
+                (mins[row], maxs[row], lasts[row], counts[row]) if has_values[row] else self._EMPTY_STATS
+                for row in range(len(missing))
+            ]
+        for key, (mn, mx, last, count) in zip(missing, states):
+            if count:
+                state = (float(mn), float(mx), float(last), int(count))
+                result[key] = state[:3]
+            else:
+                state = self._EMPTY_STATS
+            if key in self._columns:
+                self._stats[key] = state
+        return result
+
+    def block(self, keys: Sequence[str]) -> np.ndarray:
+        """Liefert die Spalten zu ``keys`` als ``(len(keys), N)``-Matrix.
+
+        Gecachte Spalten werden kopiert, alle übrigen gemeinsam in einem
+        Durchlauf über die Records projiziert.
+        """
+
+        out = np.empty((len(keys), len(self._records)), dtype=np.float64)
+        missing: List[int] = []
+        for row, key in enumerate(keys):
+            if key in self._columns:
+                out[row] = self.column(key)
+            else:
+                missing.append(row)
+        if missing:
+            out[missing] = _numeric_block(self._records, [keys[row] for row in missing])
+        return out
+
+    def _append_stats(self, key: str, values: np.ndarray) -> None:
+        state = self._stats.get(key)
+        if state is None:
+            return
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        self._stats[key] = (
+            min(state[0], float(values.min())),
+            max(state[1], float(values.max())),
+            float(values[-1]),
+            state[3] + len(values),
+        )
 
-        unit_text = (unit or '')[:3]
-        unit_block = unit_text.rjust(3) if unit_text else '   '
-        return _nb(f"{numeric} {unit_block}")
+    def _evict_stats(self, key: str, values: np.ndarray) -> None:
+        state = self._stats.get(key)
+        if state is None:
+            return
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        count = state[3] - len(values)
+        if count <= 0:
+            self._stats[key] = self._EMPTY_STATS
+        elif values.min() <= state[0] or values.max() >= state[1]:
+            # Ein Extremum fällt heraus; beim nächsten Abruf neu bestimmen.
+            self._stats[key] = None
+        else:
+            self._stats[key] = state[:3] + (count,)
 
+    def column(self, key: str, keep: bool = True) -> np.ndarray:
+        """Liefert die Spalte zu ``key`` als Sicht; ``keep=False`` cached sie nicht."""
 
+        storage = self._columns.get(key)
+        if storage is not None:
+            return storage[self._start:self._size]
+        values = _numeric_column(self._records, key)
+        if not keep:
+            return values
+        return self._store(key, values)
 
-class UnitPlot(QtWidgets.QFrame):
-    """Wrapper um einen Plot je SI-Einheit."""
+    def prefetch(self, keys: Iterable[str]) -> None:
+        """Nimmt alle noch fehlenden ``keys`` in einem Durchlauf über die Records auf."""
 
-    def __init__(self, unit: str | None = None, parent: QtWidgets.QWidget | None = None) -> None:
-        super().__init__(parent)
-        self.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.setStyleSheet(
-            "QFrame {background: white; border-radius: 12px; border: 1px solid %s;}" % colors.PRIMARY_LIGHT
-        )
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(16, 12, 16, 16)
-        layout.setSpacing(8)
+        missing = [key for key in dict.fromkeys(keys) if key not in self._columns]
+        if not missing:
+            return
+        for key, values in zip(missing, _numeric_block(self._records, missing)):
+            self._store(key, values)
 
-        self._title_label = QtWidgets.QLabel()
-        self._title_label.setStyleSheet(
-            "QLabel {color: %s; font-weight: 600; font-size: 16px;}" % colors.PRIMARY_DARK
-        )
-        layout.addWidget(self._title_label)
-
-        self.plot = pg.PlotWidget(background=colors.BACKGROUND)
-        self.plot.showGrid(x=True, y=True, alpha=0.25)
-        self.plot.getPlotItem().getAxis("left").setPen(pg.mkPen(colors.MUTED_TEXT))
-        self.plot.getPlotItem().getAxis("bottom").setPen(pg.mkPen(colors.MUTED_TEXT))
-        self.plot.getPlotItem().getAxis("left").setTextPen(pg.mkPen(colors.MUTED_TEXT))
-        self.plot.getPlotItem().getAxis("bottom").setTextPen(pg.mkPen(colors.MUTED_TEXT))
+    def _store(self, key: str, values: np.ndarray) -> np.ndarray:
+        if self._columns:
+            capacity = len(next(iter(self._columns.values())))
+        else:
+            self._start = 0
+            self._size = len(values)
+            capacity = max(16, 2 * self._size)
+        storage = np.empty(capacity, dtype=np.float64)
+        storage[self._start:self._size] = values
+        self._columns[key] = storage
+        return storage[self._start:self._size]
+
+    def _reserve(self, keep: int, count: int) -> None:
+        capacity = len(next(iter(self._columns.values())))
+        if self._size + count <= capacity:
+            return
+        keep = min(keep, len(self))
+        begin = self._size - keep
+        if keep + count > capacity:
+            capacity = 2 * (keep + count)
+            for key, storage in self._columns.items():
+                grown = np.empty(capacity, dtype=np.float64)
+                grown[:keep] = storage[begin:self._size]
+                self._columns[key] = grown
+        else:
+            for storage in self._columns.values():
+                storage[:keep] = storage[begin:self._size]
+        self._start = 0
+        self._size = keep
+
+
+class UnitPlot:
+    """Wrapper um einen ``PlotItem`` je SI-Einheit innerhalb des ``UnitPlotStack``."""
+
+    def __init__(self, unit: str | None = None) -> None:
+        self.plot = pg.PlotItem()
+        self.plot.showGrid(x=True, y=True, alpha=0.15)
+        # Das Kontextmenü wird sonst je Plot aufgebaut, aber nie benutzt.
+        self.plot.setMenuEnabled(False)
+        axis_pen = _pen_for(colors.MUTED_TEXT, 1)
+        for name in ("left", "bottom"):
+            axis = self.plot.getAxis(name)
+            axis.setPen(axis_pen)
+            axis.setTextPen(axis_pen)
         self.plot.setLabel("bottom", "Zeit", "s")
+        self.plot.setDownsampling(ds=True, auto=True, mode="peak")
+        self.plot.setClipToView(True)
         legend = self.plot.addLegend()
         if legend is not None:
             legend.anchor((1, 1), (1, 1))
             legend.setOffset((-10, -10))
-        layout.addWidget(self.plot, stretch=1)
 
         self._unit: str | None = None
         if unit:
@@ -549,28 +1191,108 @@ class UnitPlot(QtWidgets.QFrame):
 
     def configure(self, unit: str) -> None:
         self._unit = unit
-        self._title_label.setText(f"Messwerte in {unit}")
+        self.plot.setTitle(f"Messwerte in {unit}", **_PLOT_TITLE_STYLE)
         self.plot.setLabel("left", f"Wert [{unit}]")
         self.enable_auto_y()
-        self.show()
 
     def clear_unit(self) -> None:
         self._unit = None
-        self._title_label.setText("Messwerte")
+        self.plot.setTitle("Messwerte", **_PLOT_TITLE_STYLE)
         self.plot.clear()
         self.enable_auto_y()
-        self.hide()
+
+    def add_curve(self, name: str, pen: QtGui.QPen) -> pg.PlotDataItem:
+        return self.plot.plot(name=name, pen=pen)
+
+    @staticmethod
+    def set_curve_idle(curve: pg.PlotDataItem, idle: bool) -> None:
+        """Item-Cache nur für Kurven ohne neue Daten.
+
+        Overlays und Layout-Änderungen zeichnen ruhende Kurven dann nicht neu;
+        jedes ``setData`` würde den Cache dagegen verwerfen. Mit OpenGL gibt es
+        keinen Cache, sonst malt Qt in eine Pixmap statt über ``paintGL``.
+        """
+
+        cached = idle and not pg.getConfigOption("useOpenGL")
+        mode = (
+            QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+            if cached
+            else QtWidgets.QGraphicsItem.CacheMode.NoCache
+        )
+        if curve.curve.cacheMode() != mode:
+            curve.curve.setCacheMode(mode)
+
+    def bin_count(self) -> int:
+        """Pixelbreite für die M4-Reduktion, ``0`` solange die X-Achse gezoomt ist."""
+
+        view_box = self.plot.getViewBox()
+        master = view_box.linkedView(pg.ViewBox.XAxis) or view_box
+        if not master.autoRangeEnabled()[0]:
+            return 0
+        return max(0, int(view_box.width()))
 
     def set_y_bounds(self, lower: float, upper: float) -> None:
-        item = self.plot.getPlotItem()
-        item.enableAutoRange(axis="y", enable=False)
-        item.setYRange(lower, upper, padding=0)
+        self.plot.enableAutoRange(axis="y", enable=False)
+        self.plot.setYRange(lower, upper, padding=0)
 
     def enable_auto_y(self) -> None:
-        item = self.plot.getPlotItem()
-        item.enableAutoRange(axis="y", enable=True)
+        self.plot.enableAutoRange(axis="y", enable=True)
+
 
+class UnitPlotStack(QtWidgets.QFrame):
+    """Alle Einheiten-Plots untereinander in einer Grafikfläche mit gekoppelter X-Achse."""
 
+    _ROW_MIN_HEIGHT = 180
+    _ROW_SPACING = 16
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.setStyleSheet(_CARD_QSS)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(16, 12, 16, 16)
+        self.view = pg.GraphicsLayoutWidget()
+        self.view.setBackground(colors.BACKGROUND)
+        self.view.ci.setSpacing(self._ROW_SPACING)
+        layout.addWidget(self.view)
+        self._plots: List[UnitPlot] = []
+        self._x_master: UnitPlot | None = None
+
+    def set_plots(self, plots: List[UnitPlot]) -> None:
+        """Zeigt ``plots`` von oben nach unten; nur die unterste X-Achse ist beschriftet."""
+
+        if plots == self._plots:
+            return
+        layout = self.view.ci
+        for plot in self._plots:
+            layout.removeItem(plot.plot)
+            plot.plot.setXLink(None)
+        last = len(plots) - 1
+        for row, plot in enumerate(plots):
+            layout.addItem(plot.plot, row=row, col=0)
+            plot.plot.showAxis("bottom", row == last)
+        self._plots = list(plots)
+        rows = len(plots)
+        self.view.setMinimumHeight(max(0, rows * self._ROW_MIN_HEIGHT + (rows - 1) * self._ROW_SPACING))
+        master, self._x_master = self._x_master, None
+        self.link_x(master if master in plots else None)
+
+    def link_x(self, master: UnitPlot | None) -> None:
+        """Koppelt die X-Achsen an ``master``.
+
+        Nur ein Plot mit Daten taugt als Master, da gekoppelte Plots dessen
+        automatischen Bereich übernehmen.
+        """
+
+        if master is self._x_master:
+            return
+        self._x_master = master
+        for plot in self._plots:
+            if master is None or plot is master:
+                plot.plot.setXLink(None)
+                plot.plot.enableAutoRange(axis="x", enable=True)
+            else:
+                plot.plot.setXLink(master.plot)
 
 
 META_GROUP_DEFINITIONS: Dict[str, set[str]] = {
@@ -580,6 +1302,33 @@ META_GROUP_DEFINITIONS: Dict[str, set[str]] = {
     "Grenzwerte": {"P72", "P90", "P91", "P92"},
 }
 META_GROUP_ORDER = ["Ladegerät", "Batterie", "Temperaturfenster", "Grenzwerte", "Weitere Angaben"]
+# Die Gruppen sind disjunkt, die Umkehrung ist daher eindeutig.
+_META_GROUP_BY_KEY: Dict[str, str] = {
+    key: group for group, keys in META_GROUP_DEFINITIONS.items() for key in keys
+}
+
+
+def _format_meta_number(number: Number) -> str:
+    if isinstance(number, int):
+        return str(number)
+    return ("%.3f" % number).rstrip("0").rstrip(".")
+
+
+# Meta-Werte wiederholen sich bei jedem Statuswechsel; Parsen und
+# Formatieren passieren je (Wert, Key) nur einmal.
+@lru_cache(maxsize=512)
+def _format_meta_value(value: str, key: str) -> str:
+    info = PARAMETERS.get(key)
+    if not info:
+        return str(value)
+    casted = info.cast(str(value))
+    if isinstance(casted, (int, float)):
+        formatted = _format_meta_number(casted)
+    else:
+        formatted = str(casted)
+    if info.unit:
+        return f"{formatted} {info.unit}"
+    return formatted
 
 
 class MetaDetailPanel(QtWidgets.QFrame):
@@ -588,50 +1337,73 @@ class MetaDetailPanel(QtWidgets.QFrame):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.setStyleSheet(
-            "QFrame {background: white; border-radius: 12px; border: 1px solid %s;}" % colors.PRIMARY_LIGHT
-        )
+        self.setStyleSheet(_CARD_QSS)
 
         outer = QtWidgets.QVBoxLayout(self)
         outer.setContentsMargins(18, 18, 18, 18)
         outer.setSpacing(12)
 
         title = QtWidgets.QLabel("Geräteinformationen")
-        title.setStyleSheet(
-            "QLabel {color: %s; font-size: 18px; font-weight: 600;}" % colors.PRIMARY_DARK
-        )
+        title.setStyleSheet(_META_TITLE_QSS)
         outer.addWidget(title)
 
         subtitle = QtWidgets.QLabel(
             "Stammdaten aus dem ersten Datenblock. Die Werte ändern sich nur bei einem neuen Stream."
         )
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet(
-            "QLabel {color: %s; font-size: 13px;}" % colors.MUTED_TEXT
-        )
+        subtitle.setStyleSheet(_META_SUBTITLE_QSS)
         outer.addWidget(subtitle)
 
-        self._scroll = QtWidgets.QScrollArea()
-        self._scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self._scroll.setWidgetResizable(True)
-
-        self._scroll_content = QtWidgets.QWidget()
-        self._groups_layout = QtWidgets.QVBoxLayout(self._scroll_content)
-        self._groups_layout.setContentsMargins(0, 0, 0, 0)
-        self._groups_layout.setSpacing(12)
-        self._scroll.setWidget(self._scroll_content)
-
-        outer.addWidget(self._scroll, 1)
+        self._outer = outer
+        # Scrollbereich und Gruppen entstehen erst mit dem ersten Datenblock.
+        self._scroll: QtWidgets.QScrollArea | None = None
+        self._group_boxes: Dict[str, QtWidgets.QGroupBox] = {}
+        self._group_forms: Dict[str, QtWidgets.QFormLayout] = {}
+        self._group_keys: Dict[str, List[str]] = {}
+        self._field_rows: Dict[str, Tuple[QtWidgets.QLabel, QtWidgets.QLineEdit]] = {}
+        self._current_values: Dict[str, str] = {}
+        self._status_row: Tuple[QtWidgets.QLabel, QtWidgets.QLabel] | None = None
 
         self._placeholder = QtWidgets.QLabel("Noch keine Geräteinformationen empfangen.")
         self._placeholder.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self._placeholder.setStyleSheet(
-            "QLabel {color: %s; font-style: italic;}" % colors.MUTED_TEXT
-        )
+        self._placeholder.setStyleSheet(_META_PLACEHOLDER_QSS)
         outer.addWidget(self._placeholder)
 
-        self._placeholder.show()
-        self._scroll.hide()
+    def _ensure_built(self) -> QtWidgets.QScrollArea:
+        if self._scroll is not None:
+            return self._scroll
+
+        scroll = QtWidgets.QScrollArea()
+        scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        scroll.setWidgetResizable(True)
+
+        content = QtWidgets.QWidget()
+        content.setStyleSheet(_META_CONTENT_QSS)
+        groups_layout = QtWidgets.QVBoxLayout(content)
+        groups_layout.setContentsMargins(0, 0, 0, 0)
+        groups_layout.setSpacing(12)
+        scroll.setWidget(content)
+
+        # Gruppen und Felder bleiben bestehen; update_meta ändert nur Texte und
+        # ordnet eine Gruppe neu, wenn sich ihre Keys ändern.
+        for group in META_GROUP_ORDER:
+            box = QtWidgets.QGroupBox(group)
+            box.setObjectName("metaGroup")
+            form = QtWidgets.QFormLayout()
+            form.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
+            form.setHorizontalSpacing(14)
+            form.setVerticalSpacing(8)
+            box.setLayout(form)
+            box.hide()
+            groups_layout.addWidget(box)
+            self._group_boxes[group] = box
+            self._group_forms[group] = form
+            self._group_keys[group] = []
+        groups_layout.addStretch(1)
+
+        self._outer.insertWidget(self._outer.indexOf(self._placeholder), scroll, 1)
+        self._scroll = scroll
+        return scroll
 
     def update_meta(
         self,
@@ -642,17 +1414,12 @@ class MetaDetailPanel(QtWidgets.QFrame):
         has_content = bool(meta) or status_value is not None
         if not has_content:
             self._placeholder.show()
-            self._scroll.hide()
+            if self._scroll is not None:
+                self._scroll.hide()
             return
 
         self._placeholder.hide()
-        self._scroll.show()
-
-        while self._groups_layout.count():
-            item = self._groups_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        self._ensure_built().show()
 
         combined = dict(meta)
         if status_value is not None:
@@ -663,96 +1430,100 @@ class MetaDetailPanel(QtWidgets.QFrame):
             group = self._group_name_for_key(key)
             grouped.setdefault(group, []).append(key)
 
-        for group in META_GROUP_ORDER:
-            keys = grouped.get(group)
-            if not keys:
-                continue
-            box = QtWidgets.QGroupBox(group)
-            box.setStyleSheet(
-                "QGroupBox {border: 1px solid %s; border-radius: 10px; margin-top: 12px; padding: 10px 12px;}"
-                "QGroupBox::title {subcontrol-origin: margin; left: 12px; padding: 0 4px; color: %s; font-weight: 600;}"
-                % (colors.PRIMARY_LIGHT, colors.PRIMARY_DARK)
-            )
-            form = QtWidgets.QFormLayout()
-            form.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
-            form.setHorizontalSpacing(14)
-            form.setVerticalSpacing(8)
-
-            for key in keys:
-                info = PARAMETERS.get(key)
-                caption = self._build_caption(key, info)
-                value = combined[key]
-                field = self._create_value_field(value, info)
-                form.addRow(caption, field)
-                if key == "P05":
-                    detail_widget = self._build_status_details(status_detail)
-                    form.addRow(self._status_caption(), detail_widget)
-
-            box.setLayout(form)
-            self._groups_layout.addWidget(box)
-
-        self._groups_layout.addStretch(1)
+        # Umsortierte Gruppen und geänderte Texte ergeben einen einzigen Repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            for group in META_GROUP_ORDER:
+                keys = grouped.get(group, [])
+                self._sync_group(group, keys)
+                for key in keys:
+                    self._set_field_value(key, _format_meta_value(combined[key], key))
+
+            if "P05" in combined and self._status_row is not None:
+                detail_label = self._status_row[1]
+                text = self._status_text(status_detail)
+                if detail_label.text() != text:
+                    detail_label.setText(text)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _sync_group(self, group: str, keys: List[str]) -> None:
+        previous = self._group_keys[group]
+        if keys == previous:
+            return
+        form = self._group_forms[group]
+        while form.rowCount():
+            form.takeRow(0)
+        for key in previous:
+            if key not in keys:
+                for widget in self._row_widgets(key):
+                    widget.hide()
+                self._current_values.pop(key, None)
+        for key in keys:
+            caption, field = self._field_row(key)
+            form.addRow(caption, field)
+            if key == "P05":
+                form.addRow(*self._status_widgets())
+            for widget in self._row_widgets(key):
+                widget.show()
+        self._group_keys[group] = list(keys)
+        self._group_boxes[group].setVisible(bool(keys))
+
+    def _row_widgets(self, key: str) -> List[QtWidgets.QWidget]:
+        widgets: List[QtWidgets.QWidget] = list(self._field_rows.get(key, ()))
+        if key == "P05" and self._status_row is not None:
+            widgets.extend(self._status_row)
+        return widgets
+
+    def _field_row(self, key: str) -> Tuple[QtWidgets.QLabel, QtWidgets.QLineEdit]:
+        row = self._field_rows.get(key)
+        if row is None:
+            row = (self._build_caption(key, PARAMETERS.get(key)), self._create_value_field())
+            self._field_rows[key] = row
+        return row
+
+    def _status_widgets(self) -> Tuple[QtWidgets.QLabel, QtWidgets.QLabel]:
+        if self._status_row is None:
+            self._status_row = (self._status_caption(), self._build_status_details(None))
+        return self._status_row
+
+    def _set_field_value(self, key: str, text: str) -> None:
+        if self._current_values.get(key) == text:
+            return
+        self._current_values[key] = text
+        self._field_rows[key][1].setText(text)
 
     def _group_name_for_key(self, key: str) -> str:
-        for group, keys in META_GROUP_DEFINITIONS.items():
-            if key in keys:
-                return group
-        return "Weitere Angaben"
+        return _META_GROUP_BY_KEY.get(key, "Weitere Angaben")
 
     def _build_caption(self, key: str, info) -> QtWidgets.QLabel:
         description = getattr(info, "description", "") if info else ""
         text = f"{key} – {description}" if description else key
         label = QtWidgets.QLabel(text)
-        label.setStyleSheet(
-            "QLabel {color: %s; font-weight: 500;}" % colors.TEXT
-        )
+        label.setObjectName("metaCaption")
         return label
 
-    def _create_value_field(self, value: str, info) -> QtWidgets.QLineEdit:
-        display_value = self._format_value(value, info)
+    def _create_value_field(self) -> QtWidgets.QLineEdit:
         field = QtWidgets.QLineEdit()
         field.setReadOnly(True)
-        field.setText(display_value)
-        field.setStyleSheet(
-            "QLineEdit {background: %s; border: 1px solid %s; border-radius: 6px; padding: 6px 8px;}"
-            % (colors.BACKGROUND, colors.PRIMARY_LIGHT)
-        )
+        field.setObjectName("metaField")
         return field
 
-    def _format_value(self, value: str, info) -> str:
-        if not info:
-            return str(value)
-        casted = info.cast(str(value))
-        if isinstance(casted, (int, float)):
-            formatted = self._format_number(casted)
-        else:
-            formatted = str(casted)
-        if info.unit:
-            return f"{formatted} {info.unit}"
-        return formatted
-
-    def _format_number(self, number: Number) -> str:
-        if isinstance(number, int):
-            return str(number)
-        return ("%.3f" % number).rstrip("0").rstrip(".")
-
     def _status_caption(self) -> QtWidgets.QLabel:
         label = QtWidgets.QLabel("Statusdetails")
-        label.setStyleSheet(
-            "QLabel {color: %s; font-weight: 500;}" % colors.TEXT
-        )
+        label.setObjectName("metaCaption")
         return label
 
-    def _build_status_details(self, status_detail: StatusDetail | None) -> QtWidgets.QWidget:
-        text = "Keine Statusinformationen verfügbar."
+    @staticmethod
+    def _status_text(status_detail: StatusDetail | None) -> str:
         if status_detail and status_detail.details:
-            text = "\n".join(status_detail.details)
-        widget = QtWidgets.QLabel(text)
+            return "\n".join(status_detail.details)
+        return "Keine Statusinformationen verfügbar."
+
+    def _build_status_details(self, status_detail: StatusDetail | None) -> QtWidgets.QLabel:
+        widget = QtWidgets.QLabel(self._status_text(status_detail))
         widget.setWordWrap(True)
-        widget.setStyleSheet(
-            "QLabel {background: %s; border: 1px solid %s; border-radius: 6px; padding: 6px 8px; color: %s;}"
-            % ("white", colors.PRIMARY_LIGHT, colors.TEXT)
-        )
+        widget.setStyleSheet(_META_STATUS_QSS)
         widget.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
         return widget
 
@@ -767,10 +1538,9 @@ class StatusBadgeBar(QtWidgets.QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
         self._strategy_label = QtWidgets.QLabel()
-        self._strategy_label.setStyleSheet(
-            "QLabel {background: %s; color: white; border-radius: 14px; padding: 6px 12px; font-weight: 600;}"
-            % colors.PRIMARY
-        )
+        self.setStyleSheet(_BADGE_BAR_QSS)
+        self._strategy_label.setObjectName("strategyBadge")
+        self._strategy_label.hide()
         layout.addWidget(self._strategy_label)
         self._status_layout = QtWidgets.QHBoxLayout()
         self._status_layout.setContentsMargins(0, 0, 0, 0)
@@ -778,6 +1548,9 @@ class StatusBadgeBar(QtWidgets.QWidget):
         layout.addLayout(self._status_layout)
         layout.addStretch(1)
         self._badges: list[QtWidgets.QLabel] = []
+        self._last_strategy: str | None = None
+        self._last_badges: tuple[str, ...] = ()
+        self._last_visible = False
         self.setLayout(layout)
         self.hide()
 
@@ -787,42 +1560,48 @@ class StatusBadgeBar(QtWidgets.QWidget):
     def update_state(self, meta: Dict[str, str], status_detail: StatusDetail | None) -> None:
         strategy_code = meta.get("P04")
         friendly = label_strategy(strategy_code, self._config.strategy_labels)
-        if friendly:
-            self._strategy_label.setText(friendly)
-            self._strategy_label.show()
-        elif strategy_code:
-            self._strategy_label.setText(str(strategy_code))
-            self._strategy_label.show()
-        else:
-            self._strategy_label.hide()
-
-        for badge in self._badges:
-            self._status_layout.removeWidget(badge)
-            badge.deleteLater()
-        self._badges.clear()
-
-        statuses: list[str] = []
-        if status_detail:
-            statuses = status_detail.badges
-
-        for text in statuses:
-            badge = QtWidgets.QLabel(text)
-            badge.setStyleSheet(
-                "QLabel {background: %s; color: white; border-radius: 12px; padding: 4px 10px; font-weight: 500;}"
-                % colors.PRIMARY_DARK
-            )
-            self._status_layout.addWidget(badge)
-            self._badges.append(badge)
+        strategy = friendly or (str(strategy_code) if strategy_code else None)
+        statuses = tuple(status_detail.badges) if status_detail else ()
+        visible = bool(strategy or statuses)
+        # Im Dauerbetrieb ändert sich meist nichts; dann bleibt das Layout unberührt.
+        if (strategy, statuses, visible) == (self._last_strategy, self._last_badges, self._last_visible):
+            return
 
-        if friendly or strategy_code or statuses:
-            self.show()
-        else:
-            self.hide()
+        self.setUpdatesEnabled(False)
+        try:
+            if strategy != self._last_strategy:
+                if strategy:
+                    self._strategy_label.setText(strategy)
+                self._strategy_label.setVisible(bool(strategy))
+
+            if statuses != self._last_badges:
+                # Badges werden wiederverwendet; der Pool wächst nur bis zum Höchststand.
+                while len(self._badges) < len(statuses):
+                    badge = QtWidgets.QLabel()
+                    badge.setObjectName("statusBadge")
+                    self._status_layout.addWidget(badge)
+                    self._badges.append(badge)
+                for badge, text in zip(self._badges, statuses):
+                    if badge.text() != text:
+                        badge.setText(text)
+                    badge.show()
+                for badge in self._badges[len(statuses):]:
+                    badge.hide()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self.setVisible(visible)
+        self._last_strategy = strategy
+        self._last_badges = statuses
+        self._last_visible = visible
 
 
 class MainWindow(QtWidgets.QMainWindow):
     """Zentrales Fenster mit Plot, Tabelle und Metadaten."""
 
+    # Ziel des Berichts und Fehlertext (leer bei Erfolg), aus dem Export-Thread.
+    report_finished = QtCore.Signal(object, str)
+
     def __init__(self, databus: DataBus, config: AppConfig, controller: AcquisitionController | None = None, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.databus = databus
@@ -830,29 +1609,71 @@ class MainWindow(QtWidgets.QMainWindow):
         self.config = controller.config if controller else config
         self._open_raw_action: QtGui.QAction | None = None
         self._pdf_action: QtGui.QAction | None = None
+        # Der PDF-Bericht wird in einem eigenen Thread gerendert (Chromium-Start
+        # und Layout dauern Sekunden); es läuft höchstens ein Export gleichzeitig.
+        self._report_executor: ThreadPoolExecutor | None = None
+        self._report_future: Future | None = None
+        self.report_finished.connect(self._on_report_finished)
         self._config_action: QtGui.QAction | None = None
         self._config_warning: ConfigurationWarningOverlay | None = None
         self._auto_stop_checkbox: QtWidgets.QCheckBox | None = None
         self.setWindowTitle("WeTech Telemetrie Monitor")
         self.resize(1360, 780)
         self._x_key = "P06"
+        # Achsenbeschriftung für den Bericht; die X-Achse ist fest.
+        x_info = PARAMETERS.get(self._x_key)
+        self._x_caption = f"{self._x_key} – {x_info.description}" if x_info and x_info.description else self._x_key
+        self._x_unit = x_info.unit if x_info else None
         self._preferences = load_preferences()
         self._auto_stop_enabled = bool(self._preferences.get('auto_stop_full_battery', False))
         self._auto_stop_since: datetime | None = None
         self._auto_stop_triggered = False
         self._color_overrides: Dict[str, str] = self._preferences.get('parameter_colors', {})
+        # Einstellungen in Parameterreihenfolge; wie die aktiven Keys nur nach
+        # Änderungen an den Einstellungen neu bestimmt.
+        self._settings_cache: List[ParameterSetting] | None = None
+        self._active_keys_cache: List[str] | None = None
+        self._units_cache: Dict[str, List[str]] | None = None
+        # Regelbasierte Standardfarben je Key; Overrides haben stets Vorrang.
+        self._resolved_colors: Dict[str, str] = {}
+        self._fallback_colors: Dict[str, str] = {}
         self._parameter_order: List[str] = list(PARAMETERS.keys())
         self._parameter_settings: Dict[str, ParameterSetting] = self._default_parameter_settings()
         self._curves: Dict[str, pg.PlotDataItem] = {}
         self._curve_units: Dict[str, str] = {}
+        self._curve_buffers: Dict[str, CurveBuffer] = {}
+        # Je Kurve: (Pufferversion, Binanzahl, Minimum, Maximum) des letzten setData.
+        self._curve_state: Dict[str, Tuple[int, int, float, float]] = {}
+        self._series = SeriesCache()
+        self._status_cache: Dict[int, StatusDetail] = {}
+        # X-Achse und Statusmarker des letzten Snapshots, erkannt an Identität
+        # und Länge der Record-Liste.
+        self._x_cache: Tuple[Sequence[Dict[str, Number | str]], int, np.ndarray] | None = None
+        self._marker_cache: Tuple[Sequence[Dict[str, Number | str]], int, List[StatusMarker]] | None = None
+        self._seen_count = 0
+        # Laufende Nummer des ältesten Records im Snapshot, gezählt ab dem
+        # ersten Snapshot nach Start oder Reset. Dient als X-Ersatz ohne P06
+        # und bindet die Kurvenpuffer an das Fenster des DataBus.
+        self._record_origin: int | None = None
+        self._record_base = 0
+        # Erzwingt einen vollständigen Refresh, auch wenn keine Daten neu sind.
+        self._refresh_pending = True
+        # Statuswort des letzten Records und seine Dekodierung, gesetzt im Refresh.
+        self._last_status_value: Number | str | None = None
+        self._last_status_detail: StatusDetail | None = None
+        self._shown_meta: Tuple[Dict[str, str], Number | str | None, StatusDetail] | None = None
         self._unit_plots: Dict[str, UnitPlot] = {}
+        self._last_ordered_units: Tuple[str, ...] = ()
         self._last_records: List[Dict[str, Number | str]] = []
         self._auto_initialized: set[str] = set()
         self._meta_keys: set[str] = set(META_PARAMETER_KEYS)
         self._main_splitter: QtWidgets.QSplitter | None = None
         self._seen_generation = self.databus.generation()
         self._temperature_limits: Tuple[float, float] | None = None
+        self._temp_meta_sig: Tuple[str | None, ...] | None = None
+        self._sidebar_dirty = False
 
+        _fast.warm_up()
         self._init_palette()
         self._init_ui()
 
@@ -863,10 +1684,19 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._refresh_action_state()
 
+        # Einzelschuss-Timer, der nach jedem Refresh neu geplant wird; so staut
+        # sich bei langsamen Frames keine Warteschlange auf.
+        self._refresh_delays: deque[float] = deque(maxlen=300)
         self._timer = QtCore.QTimer(self)
-        interval = max(15, int(1000 / max(1.0, self.config.ui_refresh_hz)))
-        self._timer.timeout.connect(self.refresh)
-        self._timer.start(interval)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_refresh_timer)
+        self._apply_timer_type()
+        self._timer.start(self._refresh_period_ms())
+        # Minimiert pausiert der Refresh; Auto-Stop wird dann im Sekundentakt geprüft.
+        self._auto_stop_timer = QtCore.QTimer(self)
+        self._auto_stop_timer.setInterval(1000)
+        self._auto_stop_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self._auto_stop_timer.timeout.connect(self._on_auto_stop_timer)
 
     def _default_parameter_settings(self) -> Dict[str, ParameterSetting]:
         settings: Dict[str, ParameterSetting] = {}
@@ -888,16 +1718,6 @@ class MainWindow(QtWidgets.QMainWindow):
             )
         return settings
 
-    def _ordered_settings(self) -> List[ParameterSetting]:
-        return sorted(
-            self._parameter_settings.values(),
-            key=lambda setting: (
-                0 if setting.visible else 1,
-                setting.unit or "",
-                setting.label,
-            ),
-        )
-
     def _init_palette(self) -> None:
         palette = self.palette()
         palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor("white"))
@@ -909,7 +1729,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setPalette(palette)
 
     def _init_ui(self) -> None:
-        pg.setConfigOptions(antialias=True)
+        # OpenGL nur auf ausdrücklichen Wunsch; die Option gilt prozessweit
+        # und wird beim Erzeugen der Plots gelesen.
+        use_opengl = self.config.use_opengl and OpenGL is not None
+        pg.setConfigOptions(
+            antialias=False,
+            useOpenGL=use_opengl,
+            enableExperimental=use_opengl,
+        )
 
         central = QtWidgets.QWidget(self)
         central_layout = QtWidgets.QHBoxLayout(central)
@@ -917,7 +1744,7 @@ class MainWindow(QtWidgets.QMainWindow):
         central_layout.setSpacing(16)
 
         self.sidebar = ParameterSidebar(self._on_row_color_change)
-        self.sidebar.populate(self._ordered_settings())
+        self.sidebar.populate(self._parameter_settings.values())
         self.sidebar.changed.connect(self._on_parameter_setting_changed)
 
         content = QtWidgets.QWidget()
@@ -926,26 +1753,19 @@ class MainWindow(QtWidgets.QMainWindow):
         content_layout.setSpacing(14)
 
         header = QtWidgets.QLabel("WTC3 Telemetrie")
-        header.setStyleSheet(
-            "font-size: 28px; font-weight: 600; color: %s; letter-spacing: 0.5px;" % colors.PRIMARY
-        )
+        header.setStyleSheet(_WINDOW_HEADER_QSS)
         content_layout.addWidget(header)
 
         self.status_badges = StatusBadgeBar(self.config)
         content_layout.addWidget(self.status_badges)
 
+        # Bei vielen Einheiten wird gescrollt, statt die Plots zu stauchen.
+        self._plot_stack = UnitPlotStack()
         self._plots_scroll = QtWidgets.QScrollArea()
         self._plots_scroll.setWidgetResizable(True)
         self._plots_scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self._plots_scroll.setStyleSheet("QScrollArea {border: none;}")
-
-        self._plots_container = QtWidgets.QWidget()
-        self._plots_layout = QtWidgets.QVBoxLayout(self._plots_container)
-        self._plots_layout.setContentsMargins(0, 0, 0, 0)
-        self._plots_layout.setSpacing(16)
-        self._plots_layout.addStretch(1)
-
-        self._plots_scroll.setWidget(self._plots_container)
+        self._plots_scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._plots_scroll.setWidget(self._plot_stack)
         content_layout.addWidget(self._plots_scroll, 1)
 
         self._main_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Horizontal)
@@ -971,10 +1791,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         toolbar = self.addToolBar("Actions")
         toolbar.setMovable(False)
-        toolbar.setStyleSheet(
-            "QToolBar {background: %s; spacing: 12px;} QToolButton {color: white; background: %s; border-radius: 6px; padding: 6px 12px;}"
-            % (colors.PRIMARY_DARK, colors.PRIMARY)
-        )
+        toolbar.setStyleSheet(_TOOLBAR_QSS)
         if self._controller:
             config_action = QtGui.QAction("Data Source...", self)
             config_action.triggered.connect(self._open_config_dialog)
@@ -995,13 +1812,13 @@ class MainWindow(QtWidgets.QMainWindow):
         auto_stop_box = QtWidgets.QCheckBox('Auto-stop (Full >=1 min)')
         auto_stop_box.setChecked(self._auto_stop_enabled)
         auto_stop_box.setToolTip('Stop acquisition when the battery reports a full state for 60 seconds.')
-        auto_stop_box.setStyleSheet('QCheckBox { color: white; font-weight: 500; }')
+        auto_stop_box.setStyleSheet(_TOOLBAR_CHECKBOX_QSS)
         auto_stop_box.toggled.connect(self._toggle_auto_stop)
         toolbar.addWidget(auto_stop_box)
         self._auto_stop_checkbox = auto_stop_box
 
         self.status = self.statusBar()
-        self.status.setStyleSheet("color: %s" % colors.MUTED_TEXT)
+        self.status.setStyleSheet(_STATUS_BAR_QSS)
         self.status.showMessage("Ready")
 
         QtCore.QTimer.singleShot(0, self._init_splitter_sizes)
@@ -1066,64 +1883,84 @@ class MainWindow(QtWidgets.QMainWindow):
         return super().eventFilter(obj, event)
 
 
+    def _settings_in_order(self) -> List[ParameterSetting]:
+        if self._settings_cache is None:
+            self._settings_cache = [
+                setting for key in self._parameter_order if (setting := self._parameter_settings.get(key))
+            ]
+        return self._settings_cache
+
     def _active_graph_keys(self) -> List[str]:
-        return [
-            key
-            for key in self._parameter_order
-            if (setting := self._parameter_settings.get(key))
-            and setting.visible
-            and setting.allow_graph
-            and setting.unit
-        ]
+        if self._active_keys_cache is None:
+            self._active_keys_cache = [
+                setting.key
+                for setting in self._settings_in_order()
+                if setting.visible and setting.allow_graph and setting.unit
+            ]
+        return self._active_keys_cache
 
     def _collect_active_units(self) -> Dict[str, List[str]]:
-        units: Dict[str, List[str]] = {}
-        for key in self._active_graph_keys():
-            unit = self._parameter_settings[key].unit
-            assert unit is not None
-            units.setdefault(unit, []).append(key)
-        return units
+        if self._units_cache is None:
+            units: Dict[str, List[str]] = {}
+            for key in self._active_graph_keys():
+                unit = self._parameter_settings[key].unit
+                assert unit is not None
+                units.setdefault(unit, []).append(key)
+            self._units_cache = units
+        return self._units_cache
+
+    def _invalidate_active_units(self) -> None:
+        self._settings_cache = None
+        self._active_keys_cache = None
+        self._units_cache = None
 
     def _ensure_visible_units(self) -> Dict[str, List[str]]:
         units = self._collect_active_units()
-        ordered_units = sorted(units.keys())
-
-        for unit in ordered_units:
-            if unit not in self._unit_plots:
-                self._unit_plots[unit] = UnitPlot(parent=self._plots_container)
-
-        self._rebuild_plot_layout(ordered_units)
+        ordered_units = tuple(sorted(units.keys()))
+
+        # Läuft bei jedem Refresh; Titel, Y-Autorange und Layout werden nur
+        # angefasst, wenn sich die Menge der Einheiten geändert hat.
+        if ordered_units != self._last_ordered_units:
+            for unit in ordered_units:
+                if unit not in self._unit_plots:
+                    plot = UnitPlot()
+                    view_box = plot.plot.getViewBox()
+                    view_box.sigXRangeChanged.connect(self._on_plot_view_changed)
+                    view_box.sigResized.connect(self._on_plot_view_changed)
+                    self._unit_plots[unit] = plot
+            self._rebuild_plot_layout(ordered_units)
+            self._last_ordered_units = ordered_units
         return {unit: units[unit] for unit in ordered_units}
 
-    def _rebuild_plot_layout(self, ordered_units: List[str]) -> None:
-        while self._plots_layout.count():
-            item = self._plots_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(self._plots_container)
-
-        if not ordered_units:
-            self._plots_layout.addStretch(1)
-            return
+    def _on_plot_view_changed(self, *_args: object) -> None:
+        # Zoom und Größenänderung ändern die M4-Binanzahl. Ohne neue Samples
+        # kehrt der Refresh sonst früh zurück und die alte Reduktion bleibt stehen.
+        for key, unit in self._curve_units.items():
+            state = self._curve_state.get(key)
+            plot = self._unit_plots.get(unit)
+            if state is not None and plot is not None and state[1] != plot.bin_count():
+                self._refresh_pending = True
+                return
 
+    def _rebuild_plot_layout(self, ordered_units: Sequence[str]) -> None:
         for unit in ordered_units:
-            plot = self._unit_plots[unit]
-            plot.configure(unit)
-            plot.show()
-            self._plots_layout.addWidget(plot)
+            self._unit_plots[unit].configure(unit)
 
-        self._plots_layout.addStretch(1)
+        self._plot_stack.set_plots([self._unit_plots[unit] for unit in ordered_units])
 
         for unit, plot in self._unit_plots.items():
             if unit not in ordered_units:
                 plot.clear_unit()
-                plot.hide()
 
     def _update_plot_visibility(self) -> None:
+        # Wird nach jeder Einstellungsänderung aufgerufen; nur hier werden die
+        # zwischengespeicherten aktiven Keys und Einheiten neu bestimmt.
+        self._invalidate_active_units()
         self._ensure_visible_units()
 
     def _on_parameter_setting_changed(self, key: str, setting: ParameterSetting) -> None:
         self._parameter_settings[key] = setting
+        self._refresh_pending = True
         if not setting.visible or not setting.allow_graph:
             self._remove_curve(key)
         else:
@@ -1134,14 +1971,18 @@ class MainWindow(QtWidgets.QMainWindow):
             f"{setting.key} {state}",
             2500,
         )
-        self.sidebar.populate(self._ordered_settings())
+        if not self.sidebar.update_row(setting) and not self._sidebar_dirty:
+            # Mehrere Wechsel in einer Event-Loop-Runde ergeben einen Neuaufbau;
+            # ein bereits vorgemerkter Aufbau läuft spätestens mit dem Refresh.
+            self._sidebar_dirty = True
+            QtCore.QTimer.singleShot(0, self._flush_sidebar)
 
     def _on_row_color_change(self, key: str, color_hex: str) -> None:
         self._color_overrides[key] = color_hex
         self._preferences['parameter_colors'] = dict(self._color_overrides)
         save_preferences(self._preferences)
         if key in self._parameter_settings:
-            self._parameter_settings[key] = replace(self._parameter_settings[key], color=color_hex)
+            self._parameter_settings[key].color = color_hex
         self.sidebar.apply_color(key, color_hex)
         self._apply_curve_color(key)
 
@@ -1202,16 +2043,20 @@ class MainWindow(QtWidgets.QMainWindow):
         for key in new_meta:
             if key in self._parameter_settings:
                 self._parameter_settings.pop(key)
-                self._curves.pop(key, None)
-                self._curve_units.pop(key, None)
+                self._remove_curve(key)
                 self._auto_initialized.discard(key)
                 self.sidebar.forget_value(key)
                 changed = True
         if changed:
-            self.sidebar.populate(self._ordered_settings())
-            self._update_plot_visibility()
+            self._invalidate_active_units()
+            self._sidebar_dirty = True
 
     def _update_temperature_limits(self, meta: Dict[str, str]) -> None:
+        # Signatur aus den Rohwerten von P73 bis P76; ``_on_data_reset`` setzt sie zurück.
+        sig = tuple(meta.get(key) for key in ("P73", "P74", "P75", "P76"))
+        if sig == self._temp_meta_sig:
+            return
+        self._temp_meta_sig = sig
         values: List[float] = []
         for key in ("P73", "P74", "P75", "P76"):
             raw = meta.get(key)
@@ -1240,35 +2085,164 @@ class MainWindow(QtWidgets.QMainWindow):
                 continue
             self._auto_initialized.add(key)
 
+    def _refresh_period_ms(self) -> int:
+        return max(15, int(1000 / max(1.0, self.config.ui_refresh_hz)))
+
+    def _apply_timer_type(self) -> None:
+        # Bis 30 Hz genügt ein grober Timer; das spart Aufwachvorgänge im System.
+        if self.config.ui_refresh_hz <= 30:
+            self._timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        else:
+            self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:  # noqa: N802
+        super().changeEvent(event)
+        if event.type() != QtCore.QEvent.Type.WindowStateChange:
+            return
+        # Minimiert wird nichts gezeichnet; der Refresh pausiert bis zur Wiederherstellung.
+        if self.isMinimized():
+            self._timer.stop()
+            self._auto_stop_timer.start()
+        else:
+            self._auto_stop_timer.stop()
+            if not self._timer.isActive():
+                self._timer.start(0)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
+        if self._report_executor is not None:
+            # Ein laufender Export wird abgewartet, damit report_finished nicht
+            # erst nach dem Zerstören des Fensters ausgelöst wird.
+            if self._report_future is not None:
+                self._report_future.cancel()
+                self._report_future = None
+            # Der Browser für den Bericht gehört zum Export-Thread und wird dort beendet.
+            self._report_executor.submit(close_report_renderer)
+            self._report_executor.shutdown(wait=True)
+            self._report_executor = None
+        super().closeEvent(event)
+
+    # Als Slot registriert, damit PySide den Aufruf je Tick nicht dynamisch auflöst.
+    @QtCore.Slot()
+    def _on_refresh_timer(self) -> None:
+        started = time.perf_counter()
+        try:
+            self.refresh()
+        finally:
+            self._refresh_delays.append(time.perf_counter() - started)
+            if not self.isMinimized():
+                self._timer.start(self._next_refresh_interval())
+
+    @QtCore.Slot()
+    def _on_auto_stop_timer(self) -> None:
+        """Prüft Auto-Stop am neuesten Record, ohne Kurven oder Sidebar anzufassen."""
+
+        record = self.databus.latest()
+        self._update_auto_stop(self._decode_status(record.get("P05")) if record else None)
+
+    def _next_refresh_interval(self) -> int:
+        """Zielperiode abzüglich der vorhergesagten Dauer des nächsten Refresh.
+
+        Die Vorhersage ist ein Polynomfit über die letzten Refresh-Dauern,
+        begrenzt auf den beobachteten Wertebereich. Die Fitgewichte hängen nur
+        von der Anzahl der Dauern ab und werden je Länge einmal berechnet.
+        """
+
+        period = self._refresh_period_ms()
+        delays = self._refresh_delays
+        if not delays:
+            return period
+        if len(delays) < 10:
+            predicted = delays[-1]
+        else:
+            samples = np.fromiter(delays, dtype=np.float64, count=len(delays))
+            predicted = float(_extrapolation_weights(len(samples)) @ samples)
+            predicted = min(max(predicted, samples.min()), samples.max())
+        return max(1, int(period - predicted * 1000))
+
+    def _decode_status(self, value: Number | str | None) -> StatusDetail:
+        """``decode_status`` mit Cache je Statuswort; gilt bis zur nächsten Konfiguration."""
+
+        code = _status_code(value)
+        detail = self._status_cache.get(code)
+        if detail is None:
+            if len(self._status_cache) >= 512:
+                self._status_cache.clear()
+            detail = decode_status(None if code == _NO_STATUS else code, self.config.status_bits)
+            self._status_cache[code] = detail
+        return detail
+
     def refresh(self) -> None:
         generation = self.databus.generation()
         if generation != self._seen_generation:
             self._seen_generation = generation
             self._on_data_reset()
 
-        records = self.databus.snapshot()
+        if (
+            not self._refresh_pending
+            and self._last_records
+            and self.databus.sample_count() == self._seen_count
+        ):
+            # Keine neuen Samples: Kurven, Meta und Badges bleiben unverändert,
+            # nur die zeitabhängige Auto-Stop-Prüfung läuft weiter.
+            self._update_auto_stop(self._last_status_detail)
+            self._flush_sidebar()
+            return
+        self._refresh_pending = False
+
+        records, count = self.databus.snapshot_with_count()
+        fresh: int | None = count - self._seen_count
+        self._seen_count = count
         if not records:
             self._last_records = []
             return
+        if fresh is not None and not 0 <= fresh <= len(records):
+            fresh = None
+        if self._record_origin is None:
+            self._record_origin = count - len(records)
+        self._record_base = count - len(records) - self._record_origin
         self._last_records = records
+        self._series.sync(records, fresh)
         meta = self.databus.meta()
         if self._controller:
             self._controller.update_export_meta(meta)
         self._handle_meta_parameters(meta)
         last_record = records[-1]
-        status_detail = decode_status(last_record.get("P05"), self.config.status_bits)
-        self.status_badges.update_state(meta, status_detail)
-        self.meta_panel.update_meta(meta, last_record.get("P05"), status_detail)
+        status_value = last_record.get("P05")
+        status_detail = self._decode_status(status_value)
+        self._last_status_value = status_value
+        self._last_status_detail = status_detail
+        # Meta ändert sich selten; Panel und Badges nur bei einer Abweichung
+        # anfassen. ``status_detail`` stammt aus dem Cache, gleicher Status
+        # bedeutet daher dasselbe Objekt.
+        shown = (meta, status_value, status_detail)
+        previous = self._shown_meta
+        if previous is None or previous[0] != meta or previous[1] != status_value or previous[2] is not status_detail:
+            self._shown_meta = shown
+            self.status_badges.update_state(meta, status_detail)
+            self.meta_panel.update_meta(meta, status_value, status_detail)
         self._update_auto_stop(status_detail)
 
         self._auto_initialize_from_record(last_record)
         self._update_active_parameter_values(last_record)
 
         x_data = self._extract_x(records)
-        self._update_curves(x_data, records)
+        self._update_curves(x_data, records, fresh)
+        self._flush_sidebar()
+
+    def _flush_sidebar(self) -> None:
+        """Baut die Sidebar höchstens einmal pro Refresh neu auf."""
+
+        if not self._sidebar_dirty:
+            return
+        self._sidebar_dirty = False
+        self.sidebar.populate(self._parameter_settings.values())
+        self._update_plot_visibility()
 
     def _on_data_reset(self) -> None:
         self._last_records = []
+        self._last_status_value = None
+        self._last_status_detail = None
+        self._shown_meta = None
         self._auto_initialized.clear()
         self._auto_stop_since = None
         self._auto_stop_triggered = False
@@ -1276,8 +2250,16 @@ class MainWindow(QtWidgets.QMainWindow):
             plot.plot.clear()
         self._curves.clear()
         self._curve_units.clear()
+        self._curve_buffers.clear()
+        self._curve_state.clear()
+        self._series.clear()
+        self._x_cache = None
+        self._marker_cache = None
+        self._record_origin = None
+        self._record_base = 0
         self.sidebar.clear_values()
         self._temperature_limits = None
+        self._temp_meta_sig = None
         self._update_plot_visibility()
 
     def _update_active_parameter_values(self, record: Dict[str, Number | str]) -> None:
@@ -1287,17 +2269,35 @@ class MainWindow(QtWidgets.QMainWindow):
             value = record.get(key) if setting.visible else None
             self.sidebar.update_value(key, value, setting.unit)
 
-    def _extract_x(self, records: List[Dict[str, Number | str]]) -> List[float]:
-        x_vals: List[float] = []
-        for record in records:
-            value = record.get(self._x_key)
-            if isinstance(value, (int, float)):
-                x_vals.append(float(value))
-            else:
-                x_vals.append(float(len(x_vals)))
+    def _extract_x(self, records: Sequence[Dict[str, Number | str]]) -> np.ndarray:
+        cached = self._x_cache
+        if cached is not None and cached[0] is records and cached[1] == len(records):
+            return cached[2]
+        self._series.sync(records)
+        raw = self._series.column(self._x_key)
+        base = self._record_base
+        if _fast.HAVE_NUMBA:
+            x_vals = np.empty_like(raw)
+            _fast.fill_x(raw, x_vals, float(base))
+        else:
+            # Ohne Numba wäre fill_x eine Python-Schleife über das ganze Fenster.
+            x_vals = np.where(np.isnan(raw), np.arange(base, base + len(raw), dtype=np.float64), raw)
+        self._x_cache = (records, len(records), x_vals)
         return x_vals
 
-    def _update_curves(self, x_data: List[float], records: List[Dict[str, Number | str]]) -> None:
+    def _update_curves(
+        self,
+        x_data: Sequence[float],
+        records: Sequence[Dict[str, Number | str]],
+        fresh: int | None = None,
+    ) -> None:
+        """Aktualisiert die Kurven.
+
+        ``fresh`` gibt an, wie viele der letzten ``records`` seit dem vorigen
+        Aufruf neu sind; nur diese werden an bestehende Kurvenpuffer angehängt.
+        ``None`` baut alle Puffer aus ``records`` neu auf.
+        """
+
         visible_units = self._ensure_visible_units()
         active_keys = {key for keys in visible_units.values() for key in keys}
 
@@ -1305,39 +2305,68 @@ class MainWindow(QtWidgets.QMainWindow):
             if key not in active_keys:
                 self._remove_curve(key)
 
+        x_values = np.asarray(x_data, dtype=np.float64)
+        window = max(self.config.max_points, len(records))
+        self._series.sync(records, fresh)
+        # Neu sichtbare Parameter gemeinsam projizieren statt je Key einmal über alle Records.
+        self._series.prefetch(key for keys in visible_units.values() for key in keys)
+        tail = 0 if fresh is None else len(records) - fresh
+        base = self._record_base
+
         unit_ranges: Dict[str, Tuple[float, float]] = {}
         for unit, keys in visible_units.items():
             plot_widget = self._unit_plots[unit]
-            plot = plot_widget.plot
-            unit_min: float | None = None
-            unit_max: float | None = None
+            bins = plot_widget.bin_count()
+            unit_min = np.inf
+            unit_max = -np.inf
             for key in keys:
-                xs: List[float] = []
-                ys: List[float] = []
-                for x_value, record in zip(x_data, records):
-                    value = record.get(key)
-                    if isinstance(value, (int, float)):
-                        xs.append(x_value)
-                        ys.append(float(value))
-                color = QtGui.QColor(self._parameter_settings[key].color)
-                pen = pg.mkPen(color=color, width=2)
-                if key not in self._curves:
-                    label = f"{key} – {self._parameter_settings[key].label}"
-                    curve = plot.plot(name=label, pen=pen)
+                buffer = self._curve_buffers.get(key)
+                start = 0
+                if key not in self._curves or buffer is None:
+                    setting = self._parameter_settings[key]
+                    label = f"{key} – {setting.label}"
+                    curve = plot_widget.add_curve(label, _pen_for(setting.color))
                     self._curves[key] = curve
                     self._curve_units[key] = unit
+                    buffer = CurveBuffer(window)
+                    self._curve_buffers[key] = buffer
                 else:
+                    # Farbwechsel setzt _apply_curve_color direkt; hier bleibt der Stift.
                     curve = self._curves[key]
-                    curve.setPen(pen)
-                self._curves[key].setData(xs, ys)
-                if ys:
-                    current_min = min(ys)
-                    current_max = max(ys)
-                    unit_min = current_min if unit_min is None else min(unit_min, current_min)
-                    unit_max = current_max if unit_max is None else max(unit_max, current_max)
-            if unit_min is not None and unit_max is not None:
+                    if fresh is None:
+                        buffer.clear()
+                    start = tail
+                if start < len(records):
+                    column = self._series.column(key)[start:]
+                    valid = np.isfinite(column)
+                    rows = np.flatnonzero(valid) + (base + start)
+                    buffer.extend(x_values[start:][valid], column[valid], rows)
+                # Seltene Keys dürfen nicht weiter zurückreichen als der Snapshot.
+                buffer.trim(base)
+                state = self._curve_state.get(key)
+                if state is None or state[:2] != (buffer.version, bins):
+                    xs, ys = buffer.view(bins)
+                    # Zusammenhängende float32-Sichten ohne NaN: ``connect="all"`` und
+                    # ``skipFiniteCheck`` führen pyqtgraph direkt in den QPolygonF-Pfad.
+                    plot_widget.set_curve_idle(curve, False)
+                    curve.setData(xs, ys, connect="all", skipFiniteCheck=True)
+                    if len(ys):
+                        state = (buffer.version, bins, float(ys.min()), float(ys.max()))
+                    else:
+                        state = (buffer.version, bins, np.inf, -np.inf)
+                    self._curve_state[key] = state
+                else:
+                    # Unveränderte Kurven überspringen setData; erst jetzt lohnt der Cache.
+                    plot_widget.set_curve_idle(curve, True)
+                unit_min = min(unit_min, state[2])
+                unit_max = max(unit_max, state[3])
+            if unit_min <= unit_max:
                 unit_ranges[unit] = (unit_min, unit_max)
 
+        self._plot_stack.link_x(
+            next((self._unit_plots[unit] for unit in visible_units if unit in unit_ranges), None)
+        )
+
         for unit, keys in visible_units.items():
             plot_widget = self._unit_plots[unit]
             bounds = unit_ranges.get(unit)
@@ -1365,6 +2394,12 @@ class MainWindow(QtWidgets.QMainWindow):
         override = getattr(self, '_color_overrides', {}).get(key)
         if override:
             return override
+        resolved = self._resolved_colors.get(key)
+        if resolved is None:
+            resolved = self._resolved_colors[key] = self._default_color_for_key(key)
+        return resolved
+
+    def _default_color_for_key(self, key: str) -> str:
         setting = getattr(self, '_parameter_settings', {}).get(key) if hasattr(self, '_parameter_settings') else None
         info = PARAMETERS.get(key)
         label = ''
@@ -1395,41 +2430,59 @@ class MainWindow(QtWidgets.QMainWindow):
         if 'leistung' in label or 'power' in label:
             return colors.PRIMARY_LIGHT
 
-        palette = [colors.PRIMARY, colors.SECONDARY, colors.ACCENT, colors.SECONDARY_LIGHT, colors.PRIMARY_LIGHT, colors.TEXT]
-        idx = hash(key) % len(palette)
-        return palette[idx]
+        # Reihum in der Reihenfolge der ersten Anfrage (``_parameter_order``);
+        # anders als ``hash()`` unabhängig von PYTHONHASHSEED.
+        fallback = self._fallback_colors.get(key)
+        if fallback is None:
+            palette = _FALLBACK_PALETTE
+            fallback = self._fallback_colors[key] = palette[len(self._fallback_colors) % len(palette)]
+        return fallback
 
     def _remove_curve(self, key: str) -> None:
         item = self._curves.pop(key, None)
         unit = self._curve_units.pop(key, None)
+        self._curve_buffers.pop(key, None)
+        self._curve_state.pop(key, None)
         if item and unit and unit in self._unit_plots:
             self._unit_plots[unit].plot.removeItem(item)
 
     def _apply_curve_color(self, key: str) -> None:
         if key in self._curves:
-            color = QtGui.QColor(self._parameter_settings[key].color)
-            self._curves[key].setPen(pg.mkPen(color=color, width=2))
+            self._curves[key].setPen(_pen_for(self._parameter_settings[key].color))
 
     def _collect_series_for_pdf(
-        self, x_data: Sequence[float], stats: Sequence[ParameterStatistic]
+        self,
+        x_data: Sequence[float],
+        stats: Sequence[ParameterStatistic],
+        columns: Dict[str, np.ndarray] | None = None,
     ) -> List[ParameterSeries]:
+        """Baut die Reihen für den Bericht; ``columns`` übernimmt bereits projizierte Spalten."""
+
         def fmt(value: float) -> str:
             text = ("%.3f" % value).rstrip("0").rstrip(".")
             return text if text else "0"
 
+        x_values = np.asarray(x_data, dtype=np.float64)
         series_list: List[ParameterSeries] = []
         for stat in stats:
             setting = self._parameter_settings.get(stat.key)
             color = setting.color if setting else stat.color
-            xs: List[float] = []
-            ys: List[float] = []
-            for x_value, record in zip(x_data, self._last_records):
-                value = record.get(stat.key)
-                if isinstance(value, (int, float)):
-                    xs.append(float(x_value))
-                    ys.append(float(value))
-            if len(xs) < 2:
+            column = columns.get(stat.key) if columns else None
+            if column is None:
+                column = self._series.column(stat.key, keep=False)
+            valid = np.isfinite(column)
+            if np.count_nonzero(valid) < 2:
                 continue
+            # Die maskierten Kopien gehen an den Export-Thread;
+            # pdf_report rechnet direkt auf den Arrays.
+            xs = x_values[valid]
+            ys = column[valid]
+            if len(ys) > 2 * CHART_PLOT_WIDTH:
+                # Mehr als zwei Punkte je Pixelspalte sind im Diagramm nicht
+                # sichtbar; Min/Max behält je Spalte genau diese zwei.
+                keep = _minmax_indices(ys, CHART_PLOT_WIDTH)
+                xs = xs[keep]
+                ys = ys[keep]
             info = PARAMETERS.get(stat.key)
             descriptor = info.description if info and info.description else stat.label
             unit_suffix = f" {stat.unit}" if stat.unit else ""
@@ -1443,8 +2496,8 @@ class MainWindow(QtWidgets.QMainWindow):
                     label=stat.label,
                     unit=stat.unit,
                     color=color,
-                    x_values=tuple(xs),
-                    y_values=tuple(ys),
+                    x_values=xs,
+                    y_values=ys,
                     explanation=explanation,
                 )
             )
@@ -1463,9 +2516,9 @@ class MainWindow(QtWidgets.QMainWindow):
             if ": " not in entry:
                 continue
             raw_key, raw_value = entry.split(": ", 1)
-            key = STATUS_FIELD_TRANSLATIONS.get(_normalize_status_label(raw_key), raw_key.strip())
+            key = _STATUS_FIELD_LOOKUP.get(_normalize_status_label(raw_key), raw_key.strip())
             clean_value = raw_value.strip()
-            value = STATUS_VALUE_TRANSLATIONS.get(_normalize_status_label(clean_value), clean_value)
+            value = _STATUS_VALUE_LOOKUP.get(_normalize_status_label(clean_value), clean_value)
             snapshot[key] = value
         return snapshot
 
@@ -1476,19 +2529,38 @@ class MainWindow(QtWidgets.QMainWindow):
         x_data: Sequence[float],
         records: Sequence[Dict[str, Number | str]],
     ) -> List[StatusMarker]:
+        cached = self._marker_cache
+        if cached is not None and cached[0] is records and cached[1] == len(records):
+            return cached[2]
         markers: List[StatusMarker] = []
-        if not x_data or not records:
+        self._marker_cache = (records, len(records), markers)
+        if len(x_data) == 0 or not records:
             return markers
-        limit = max(0, len(records) - 1)
-        prev_snapshot: Dict[str, str] | None = None
-        for idx, (x_value, record) in enumerate(zip(x_data, records)):
-            if idx >= limit:
-                break
-            detail = decode_status(record.get("P05"), self.config.status_bits)
-            snapshot = self._status_badge_snapshot(detail)
-            if prev_snapshot is None:
-                prev_snapshot = snapshot
-                continue
+        limit = min(len(x_data), max(0, len(records) - 1))
+        if limit == 0:
+            return markers
+        # Gleiches Statuswort ergibt denselben Snapshot; dekodiert wird nur an
+        # den Stellen, an denen sich das Rohwort ändert.
+        # Nur der Export braucht P05 als Spalte; sie wird nicht in den Cache
+        # aufgenommen, sonst würde jeder Refresh sie weiterführen.
+        if self._series.holds(records):
+            raw = self._series.column("P05", keep=False)[:limit]
+        else:
+            raw = _numeric_column(records[:limit], "P05")
+        numeric = np.isfinite(raw)
+        codes = np.full(limit, _NO_STATUS, dtype=np.int64)
+        codes[numeric] = raw[numeric]
+        # Nur nicht-numerische Einträge (z. B. "1") einzeln auswerten.
+        for idx in np.flatnonzero(~numeric).tolist():
+            codes[idx] = _status_code(records[idx].get("P05"))
+
+        def snapshot_for(code: int) -> Dict[str, str]:
+            return self._status_badge_snapshot(self._decode_status(None if code == _NO_STATUS else code))
+
+        prev_snapshot = snapshot_for(int(codes[0]))
+        for idx in (np.flatnonzero(codes[1:] != codes[:-1]) + 1).tolist():
+            x_value = x_data[idx]
+            snapshot = snapshot_for(int(codes[idx]))
             if snapshot != prev_snapshot:
                 changes: List[str] = []
                 keys = sorted(set(prev_snapshot.keys()) | set(snapshot.keys()))
@@ -1528,6 +2600,9 @@ class MainWindow(QtWidgets.QMainWindow):
         QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(path)))
 
     def _export_pdf(self) -> None:
+        if self._report_future is not None:
+            self.status.showMessage("A report is already being written", 3000)
+            return
         if not self._last_records:
             QtWidgets.QMessageBox.information(
                 self,
@@ -1536,9 +2611,8 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
-        meta = self.databus.meta()
         if self._controller:
-            export_stem = self._controller.export_stem(meta)
+            export_stem = self._controller.export_stem(self.databus.meta())
             log_path = self._controller.raw_log_path()
         else:
             export_stem = datetime.now().strftime('%Y%m%d_%H%M%S_raw')
@@ -1550,6 +2624,7 @@ class MainWindow(QtWidgets.QMainWindow):
             default_dir = self.config.persist_path.parent
         else:
             default_dir = Path.cwd() / 'logs'
+        # Jedes Mal prüfen: das Verzeichnis kann inzwischen gelöscht worden sein.
         default_dir.mkdir(parents=True, exist_ok=True)
         suggested = default_dir / export_stem
         selected, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -1565,39 +2640,42 @@ class MainWindow(QtWidgets.QMainWindow):
         if target.suffix.lower() != ".pdf":
             target = target.with_suffix(".pdf")
 
-        last_record = self._last_records[-1]
-        status_value = last_record.get("P05")
-        status_detail = decode_status(status_value, self.config.status_bits)
+        # Während des Dateidialogs laufen Refreshes weiter; ab hier gilt ein
+        # fester Snapshot. Records, Meta und Status stammen alle aus dem
+        # letzten Refresh, nicht teils vom DataBus.
+        records = self._last_records
+        shown = self._shown_meta
+        if not records or shown is None:
+            return
+        meta = shown[0]
+        status_value = self._last_status_value
+        status_detail = self._last_status_detail
         strategy_code = meta.get("P04")
         strategy_label = label_strategy(strategy_code, self.config.strategy_labels)
 
-        x_data = self._extract_x(self._last_records)
-        start_x = x_data[0] if x_data else None
-        end_x = x_data[-1] if x_data else None
+        x_data = self._extract_x(records)
+        start_x = float(x_data[0]) if len(x_data) else None
+        end_x = float(x_data[-1]) if len(x_data) else None
         duration = 0.0
         if start_x is not None and end_x is not None:
             duration = max(0.0, end_x - start_x)
 
         visible_stats: List[ParameterStatistic] = []
         hidden_stats: List[ParameterStatistic] = []
-        for key in self._parameter_order:
-            setting = self._parameter_settings.get(key)
-            if not setting:
-                continue
-            values: List[float] = []
-            for record in self._last_records:
-                value = record.get(key)
-                if isinstance(value, (int, float)):
-                    values.append(float(value))
-            if not values:
+        include_hidden = self.config.include_hidden_stats
+        settings = [setting for setting in self._settings_in_order() if include_hidden or setting.visible]
+        stats = self._series.stats([setting.key for setting in settings])
+        for setting in settings:
+            if setting.key not in stats:
                 continue
+            min_value, max_value, last_value = stats[setting.key]
             stat = ParameterStatistic(
-                key=key,
+                key=setting.key,
                 label=setting.label,
                 unit=setting.unit,
-                min_value=min(values),
-                max_value=max(values),
-                last_value=values[-1],
+                min_value=min_value,
+                max_value=max_value,
+                last_value=last_value,
                 color=setting.color,
                 visible=setting.visible,
             )
@@ -1605,42 +2683,61 @@ class MainWindow(QtWidgets.QMainWindow):
                 visible_stats.append(stat)
             else:
                 hidden_stats.append(stat)
+        visible_keys = [stat.key for stat in visible_stats]
+        visible_columns = dict(zip(visible_keys, self._series.block(visible_keys)))
+
+        series_list = self._collect_series_for_pdf(x_data, visible_stats, visible_columns)
+        status_markers = self._collect_status_markers(x_data, records)
+
+        if self._report_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wtc3-report")
+        if self._pdf_action:
+            self._pdf_action.setEnabled(False)
+        self.status.showMessage(f"Writing report to {target} ...")
+        self._report_future = self._report_executor.submit(
+            self._render_report,
+            target,
+            meta,
+            status_value,
+            status_detail,
+            strategy_code,
+            strategy_label,
+            visible_stats,
+            hidden_stats if include_hidden else None,
+            series_list,
+            status_markers,
+            len(records),
+            duration,
+            self._x_caption,
+            self._x_unit,
+            start_x,
+            end_x,
+            datetime.now(),
+        )
 
-        series_list = self._collect_series_for_pdf(x_data, visible_stats)
-        status_markers = self._collect_status_markers(x_data, self._last_records)
-
-        x_info = PARAMETERS.get(self._x_key)
-        x_caption = f"{self._x_key} – {x_info.description}" if x_info and x_info.description else self._x_key
-        x_unit = x_info.unit if x_info else None
+    def _render_report(self, target: Path, *args: object) -> None:
+        """Läuft im Export-Thread; das Ergebnis geht per Signal an den UI-Thread."""
 
         try:
-            render_measurement_report(
-                target,
-                meta,
-                status_value,
-                status_detail,
-                strategy_code,
-                strategy_label,
-                visible_stats,
-                hidden_stats,
-                series_list,
-                status_markers,
-                len(self._last_records),
-                duration,
-                x_caption,
-                x_unit,
-                start_x,
-                end_x,
-                datetime.now(),
-            )
-        except Exception as exc:  # pragma: no cover - Qt Fehler schwer reproduzierbar
+            render_measurement_report(target, *args)
+        except Exception as exc:  # pragma: no cover - Playwright-Fehler schwer reproduzierbar
+            self.report_finished.emit(target, str(exc) or type(exc).__name__)
+        else:
+            self.report_finished.emit(target, "")
+
+    def _on_report_finished(self, target: Path, error: str) -> None:
+        self._report_future = None
+        if self._pdf_action:
+            self._pdf_action.setEnabled(True)
+        if error:
             QtWidgets.QMessageBox.critical(
                 self,
                 "Export fehlgeschlagen",
-                f"The report could not be generated:\n{exc}",
+                f"The report could not be generated:\n{error}",
             )
             return
-
         self.status.showMessage(f"Report saved to {target}", 4000)
 
     def _open_config_dialog(self) -> None:
@@ -1666,8 +2763,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.config = config
         self.status_badges.set_config(config)
         self._refresh_action_state()
-        interval = max(15, int(1000 / max(1.0, self.config.ui_refresh_hz)))
-        self._timer.setInterval(interval)
+        self._refresh_delays.clear()
+        self._status_cache.clear()
+        self._marker_cache = None
+        if self._last_records:
+            # Statusbits können sich geändert haben.
+            self._last_status_detail = self._decode_status(self._last_status_value)
+        self._refresh_pending = True
+        self._apply_timer_type()
+        if self._timer.isActive():
+            self._timer.start(self._refresh_period_ms())
 
 
 __all__ = ["MainWindow"]
@@ -4,12 +4,14 @@ from __future__ import annotations
 import base64
 import os
 import sys
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import html
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
+import numpy as np
 
 from ..parser import PARAMETERS, Number
 from ..status import StatusDetail
@@ -32,6 +34,8 @@ SVG_MARGIN_LEFT = 70
 SVG_MARGIN_RIGHT = 36
 SVG_MARGIN_TOP = 36
 SVG_MARGIN_BOTTOM = 60
+# Width of the chart area in SVG units, i.e. one unit per rendered pixel column.
+CHART_PLOT_WIDTH = SVG_WIDTH - SVG_MARGIN_LEFT - SVG_MARGIN_RIGHT
 GRID_LINES_X = 6
 GRID_LINES_Y = 5
 
@@ -65,6 +69,47 @@ def _ensure_playwright_browsers_path() -> None:
             break
 
 
+# Playwright's sync API is bound to the thread that started it, so the
+# browser is kept per thread and reused by later exports on that thread.
+_RENDERER = threading.local()
+
+
+def _report_browser():
+    """Return the Chromium instance of the current thread, launching it on first use."""
+
+    browser = getattr(_RENDERER, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+    playwright = getattr(_RENDERER, "playwright", None)
+    if playwright is None:
+        _ensure_playwright_browsers_path()
+        try:
+            from playwright.sync_api import sync_playwright  # type: ignore import
+        except ImportError as exc:
+            raise RuntimeError("Playwright is required for PDF export. Install it via 'pip install playwright' and run 'playwright install chromium'.") from exc
+        playwright = _RENDERER.playwright = sync_playwright().start()
+    try:
+        browser = playwright.chromium.launch(headless=True)
+    except Exception as exc:
+        raise RuntimeError("Playwright Chromium could not start. Run 'playwright install chromium'.") from exc
+    _RENDERER.browser = browser
+    return browser
+
+
+def close_report_renderer() -> None:
+    """Shut down the browser kept by the current thread, if any."""
+
+    browser = getattr(_RENDERER, "browser", None)
+    playwright = getattr(_RENDERER, "playwright", None)
+    _RENDERER.browser = _RENDERER.playwright = None
+    try:
+        if browser is not None:
+            browser.close()
+    finally:
+        if playwright is not None:
+            playwright.stop()
+
+
 @dataclass(slots=True)
 class ParameterStatistic:
     """Key metrics for a measured parameter."""
@@ -95,8 +140,8 @@ class ParameterSeries:
     label: str
     unit: str | None
     color: str
-    x_values: Sequence[float]
-    y_values: Sequence[float]
+    x_values: Sequence[float] | np.ndarray
+    y_values: Sequence[float] | np.ndarray
     explanation: str
 
 
@@ -208,37 +253,16 @@ def _load_logo_data() -> str | None:
     return None
 
 
-def _to_svg_coords(xs: Sequence[float], ys: Sequence[float]):
-    x_min = min(xs)
-    x_max = max(xs)
-    y_min = min(ys)
-    y_max = max(ys)
-    if x_max - x_min < 1e-9:
-        x_min -= 1.0
-        x_max += 1.0
-    if y_max - y_min < 1e-9:
-        y_min -= 1.0
-        y_max += 1.0
-    width = SVG_WIDTH - SVG_MARGIN_LEFT - SVG_MARGIN_RIGHT
-    height = SVG_HEIGHT - SVG_MARGIN_TOP - SVG_MARGIN_BOTTOM
-
-    def sx(x: float) -> float:
-        return SVG_MARGIN_LEFT + (x - x_min) * width / (x_max - x_min)
-
-    def sy(y: float) -> float:
-        return SVG_MARGIN_TOP + height - (y - y_min) * height / (y_max - y_min)
-
-    return sx, sy, (x_min, x_max, y_min, y_max)
-
-
 def _render_chart_svg(
     series: ParameterSeries,
     markers: Sequence[StatusMarker],
     x_caption: str,
     x_unit: str | None,
 ) -> str:
-    xs = list(series.x_values)
-    ys = list(series.y_values)
+    # Long runs produce tens of thousands of points; compute extrema and SVG
+    # coordinates on arrays instead of per point.
+    xs = np.asarray(series.x_values, dtype=np.float64)
+    ys = np.asarray(series.y_values, dtype=np.float64)
     if len(xs) < 2 or len(ys) < 2:
         return ""
 
@@ -249,8 +273,8 @@ def _render_chart_svg(
     if "temp" in series.label.lower():
         is_temperature = True
 
-    raw_min = min(ys)
-    raw_max = max(ys)
+    raw_min = float(ys.min())
+    raw_max = float(ys.max())
     if is_temperature:
         y_min = -20.0
         y_max = 80.0
@@ -262,9 +286,9 @@ def _render_chart_svg(
     if y_max - y_min < 1e-6:
         y_max = y_min + 1.0
 
-    x_min = xs[0]
-    x_max = xs[-1]
-    width = SVG_WIDTH - SVG_MARGIN_LEFT - SVG_MARGIN_RIGHT
+    x_min = float(xs[0])
+    x_max = float(xs[-1])
+    width = CHART_PLOT_WIDTH
     height = SVG_HEIGHT - SVG_MARGIN_TOP - SVG_MARGIN_BOTTOM
 
     def sx(value: float) -> float:
@@ -301,7 +325,11 @@ def _render_chart_svg(
         )
 
     color = series.color or PALETTE['primary']
-    points = " ".join(f"{sx(x):.2f},{sy(y):.2f}" for x, y in zip(xs, ys))
+    x_span = x_max - x_min if x_max - x_min > 0 else 1.0
+    y_span = y_max - y_min if y_max - y_min > 0 else 1.0
+    px = SVG_MARGIN_LEFT + (xs - x_min) * width / x_span
+    py = SVG_MARGIN_TOP + height - (ys - y_min) * height / y_span
+    points = " ".join(f"{x:.2f},{y:.2f}" for x, y in zip(px.tolist(), py.tolist()))
     series_path = f"<polyline points='{points}' fill='none' stroke='{color}' stroke-width='2.4' />"
 
     marker_elements: List[str] = []
@@ -370,7 +398,7 @@ def _build_html(
     status_detail: StatusDetail | None,
     strategy_line: str,
     visible_table_rows: str,
-    hidden_table_rows: str,
+    hidden_table_rows: str | None,
     series: Sequence[ParameterSeries],
     status_markers: Sequence[StatusMarker],
     sample_count: int,
@@ -441,13 +469,14 @@ def _build_html(
         "</table>"
     )
 
-    first_page_sections.append("<h2>Additional Parameters</h2>")
-    first_page_sections.append(
-        "<table class='stats-table'>"
-        "<tr><th>Parameter</th><th>Description</th><th>Unit</th><th>Min</th><th>Max</th><th>Last</th></tr>"
-        f"{hidden_table_rows or '<tr><td colspan="6">No additional parameters recorded.</td></tr>'}"
-        "</table>"
-    )
+    if hidden_table_rows is not None:
+        first_page_sections.append("<h2>Additional Parameters</h2>")
+        first_page_sections.append(
+            "<table class='stats-table'>"
+            "<tr><th>Parameter</th><th>Description</th><th>Unit</th><th>Min</th><th>Max</th><th>Last</th></tr>"
+            f"{hidden_table_rows or '<tr><td colspan="6">No additional parameters recorded.</td></tr>'}"
+            "</table>"
+        )
 
     first_page = (
         "<div class='page first-page'>"
@@ -536,7 +565,7 @@ def render_measurement_report(
     strategy_code: str | None,
     strategy_label: str | None,
     visible_stats: Sequence[ParameterStatistic],
-    hidden_stats: Sequence[ParameterStatistic],
+    hidden_stats: Sequence[ParameterStatistic] | None,
     series: Sequence[ParameterSeries],
     status_markers: Sequence[StatusMarker],
     sample_count: int,
@@ -547,13 +576,16 @@ def render_measurement_report(
     end_x: float | None,
     generated_at: datetime,
 ) -> None:
-    """Render a measurement report PDF."""
+    """Render a measurement report PDF.
+
+    ``hidden_stats=None`` omits the "Additional Parameters" section.
+    """
 
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
 
     visible_table_rows = _build_parameter_table_rows(visible_stats)
-    hidden_table_rows = _build_parameter_table_rows(hidden_stats)
+    hidden_table_rows = _build_parameter_table_rows(hidden_stats) if hidden_stats is not None else None
 
     start_text = _format_value(start_x, x_axis_unit)
     end_text = _format_value(end_x, x_axis_unit)
@@ -590,18 +622,8 @@ def render_measurement_report(
     except Exception:
         pass
 
-    _ensure_playwright_browsers_path()
+    page = _report_browser().new_page()
     try:
-        from playwright.sync_api import sync_playwright  # type: ignore import
-    except ImportError as exc:
-        raise RuntimeError("Playwright is required for PDF export. Install it via 'pip install playwright' and run 'playwright install chromium'.") from exc
-
-    with sync_playwright() as playwright:
-        try:
-            browser = playwright.chromium.launch(headless=True)
-        except Exception as exc:
-            raise RuntimeError("Playwright Chromium could not start. Run 'playwright install chromium'.") from exc
-        page = browser.new_page()
         page.set_content(html_content, wait_until="networkidle")
         pdf_bytes = page.pdf(
             format="A4",
@@ -609,8 +631,8 @@ def render_measurement_report(
             margin={"top": "12mm", "bottom": "14mm", "left": "16mm", "right": "16mm"},
             display_header_footer=False,
         )
+    finally:
         page.close()
-        browser.close()
     target.write_bytes(pdf_bytes)
 
 
@@ -618,5 +640,6 @@ __all__ = [
     "ParameterStatistic",
     "ParameterSeries",
     "StatusMarker",
+    "close_report_renderer",
     "render_measurement_report",
 ]